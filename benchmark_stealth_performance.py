@@ -12,13 +12,19 @@ Usage:
 
 import argparse
 import asyncio
-import json
 import os
 import statistics
 import time
+from pathlib import Path
 from typing import Dict, List
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is a dev dependency; fall back to stdlib json
+    orjson = None
+    import json
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -330,8 +336,11 @@ async def main():
             },
         }
 
-        with open(args.output, "w") as f:
-            json.dump(output_data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(output_data, indent=2).encode()
+        Path(args.output).write_bytes(payload)
 
         logger.info(f"Results saved to {args.output}")
 
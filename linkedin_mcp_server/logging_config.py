@@ -11,6 +11,9 @@ import json
 import logging
 from typing import Any, Dict
 
+# Fields callers attach through logging's extra= argument, copied into JSON logs
+EXTRA_FIELDS = ("error_type", "error_details")
+
 
 class MCPJSONFormatter(logging.Formatter):
     """JSON formatter for MCP server logs."""
@@ -31,11 +34,11 @@ class MCPJSONFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
 
-        # Add error details if present
-        if hasattr(record, "error_type"):
-            log_data["error_type"] = record.error_type
-        if hasattr(record, "error_details"):
-            log_data["error_details"] = record.error_details
+        # Add error details if present; extra= sets them on the instance dict
+        extras = vars(record)
+        for field in EXTRA_FIELDS:
+            if field in extras:
+                log_data[field] = extras[field]
 
         # Add exception info if present
         if record.exc_info:
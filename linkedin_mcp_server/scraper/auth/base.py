@@ -40,11 +40,15 @@ class LinkedInAuth(ABC):
         self._page = page
         return await self._authenticate(page)
 
-    async def login(self, context: BrowserContext) -> Page:
+    async def login(
+        self, context: BrowserContext, customize_context: bool = True
+    ) -> Page:
         """Convenience method to login and return the authenticated page.
 
         Args:
             context: Browser context instance
+            customize_context: Whether to apply auth-specific context setup
+                (skipped when the context was restored from storage state)
 
         Returns:
             Authenticated page instance
@@ -53,7 +57,8 @@ class LinkedInAuth(ABC):
             Exception if authentication fails
         """
         # Customize context for auth-specific needs
-        await self._customize_context(context)
+        if customize_context:
+            await self._customize_context(context)
         page = await context.new_page()
 
         if not await self.authenticate(page=page):
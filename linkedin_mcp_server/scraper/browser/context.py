@@ -147,8 +147,12 @@ class StealthBrowserContextManager:
         if self.storage_state_path and self.context:
             try:
                 # Ensure directory exists
-                Path(self.storage_state_path).parent.mkdir(parents=True, exist_ok=True)
+                Path(self.storage_state_path).parent.mkdir(
+                    mode=0o700, parents=True, exist_ok=True
+                )
                 await self.context.storage_state(path=self.storage_state_path)
+                # The state holds the session cookie; keep it readable by the user only
+                Path(self.storage_state_path).chmod(0o600)
                 logger.info(f"Saved storage state to {self.storage_state_path}")
             except Exception as e:
                 logger.warning(f"Failed to save storage state: {e}")
@@ -98,7 +98,9 @@ class LinkedInPageScraper(ABC):
         )
 
         if not scraping_result.success:
-            raise Exception(f"Stealth operations failed: {scraping_result.error}")
+            raise Exception(
+                f"Stealth operations failed: {scraping_result.error}"
+            ) from scraping_result.exception
 
         # Phase 2: Data extraction (pure extraction, no stealth)
         logger.debug("Stealth operations complete, extracting data")
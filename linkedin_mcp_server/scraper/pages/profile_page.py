@@ -2,7 +2,7 @@
 
 import logging
 import re
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional
 
 from patchright.async_api import Page
 
@@ -13,6 +13,30 @@ from linkedin_mcp_server.scraper.stealth.controller import ContentTarget, PageTy
 
 logger = logging.getLogger(__name__)
 
+# Called as (section_name, completed_sections, total_sections) after each section
+SectionCallback = Callable[[str, int, int], Awaitable[None]]
+
+# Collect trimmed per-element payloads in one round trip instead of shipping
+# element handles (or whole-page HTML) across the Playwright connection
+_INNER_TEXTS_JS = (
+    "(els, limit) => els.slice(0, limit ?? els.length).map(el => el.innerText)"
+)
+_HREFS_JS = "(els, limit) => els.slice(0, limit ?? els.length).map(el => el.getAttribute('href'))"
+
+# Patterns applied per header and per list item, compiled once at import
+_CONNECTION_PATTERNS = (
+    re.compile(r"(\d+(?:,\d+)*)\s+connections?", re.IGNORECASE),
+    re.compile(r"(\d+)\+\s+connections?", re.IGNORECASE),
+)
+_FOLLOWER_PATTERNS = (
+    re.compile(r"(\d+(?:,\d+)*)\s+followers?", re.IGNORECASE),
+    re.compile(r"(\d+(?:\.\d+)?[kK])\s+followers?", re.IGNORECASE),
+)
+_PRESENT_RANGE_RE = re.compile(r"(\w+\s+\d{4})\s*-\s*Present")
+_DATE_RANGE_RE = re.compile(r"(\w+\s+\d{4})\s*-\s*(\w+\s+\d{4})")
+_DURATION_RE = re.compile(r"(\d+\s+yrs?\s+\d+\s+mos?|\d+\s+yrs?|\d+\s+mos?)")
+_YEAR_RE = re.compile(r"\b\d{4}\b")
+
 
 class ProfilePageScraper(LinkedInPageScraper):
     """LinkedIn profile page scraper using centralized stealth architecture.
@@ -26,7 +50,7 @@ class ProfilePageScraper(LinkedInPageScraper):
         return PageType.PROFILE
 
     def get_content_targets(
-        self, fields: PersonScrapingFields = PersonScrapingFields.ALL
+        self, fields: PersonScrapingFields = PersonScrapingFields.ALL, **kwargs
     ) -> List[ContentTarget]:
         """Map PersonScrapingFields to ContentTargets."""
         targets = []
@@ -48,13 +72,15 @@ class ProfilePageScraper(LinkedInPageScraper):
         self,
         page: Page,
         fields: PersonScrapingFields = PersonScrapingFields.ALL,
+        on_section: Optional[SectionCallback] = None,
         **kwargs,
     ) -> Person:
         """Pure data extraction - stealth operations handled by base class.
 
         This method performs only data extraction after the StealthController
         has already prepared the page with proper navigation, content loading,
-        and behavior simulation.
+        and behavior simulation. If given, on_section is awaited after each
+        section completes so callers can surface progress incrementally.
         """
         logger.info("Starting profile data extraction (stealth-prepared)")
 
@@ -69,20 +95,25 @@ class ProfilePageScraper(LinkedInPageScraper):
             pass
 
         # Pure extraction - no stealth operations, page is already prepared
-        if PersonScrapingFields.BASIC_INFO in fields:
-            await self._extract_basic_info(page, person)
-
-        if PersonScrapingFields.EXPERIENCE in fields:
-            await self._extract_experiences(page, person)
-
-        if PersonScrapingFields.EDUCATION in fields:
-            await self._extract_education(page, person)
-
-        if PersonScrapingFields.ACCOMPLISHMENTS in fields:
-            await self._extract_accomplishments(page, person)
-
-        if PersonScrapingFields.INTERESTS in fields:
-            await self._extract_interests(page, person)
+        sections = [
+            (PersonScrapingFields.BASIC_INFO, "basic_info", self._extract_basic_info),
+            (PersonScrapingFields.EXPERIENCE, "experiences", self._extract_experiences),
+            (PersonScrapingFields.EDUCATION, "educations", self._extract_education),
+            (
+                PersonScrapingFields.ACCOMPLISHMENTS,
+                "accomplishments",
+                self._extract_accomplishments,
+            ),
+            (PersonScrapingFields.INTERESTS, "interests", self._extract_interests),
+        ]
+        enabled = [
+            (name, extract) for flag, name, extract in sections if flag in fields
+        ]
+
+        for completed, (name, extract) in enumerate(enabled, start=1):
+            await extract(page, person)
+            if on_section is not None:
+                await on_section(name, completed, len(enabled))
 
         logger.info(
             f"Extraction complete: {len(person.experiences)} experiences, "
@@ -100,6 +131,12 @@ class ProfilePageScraper(LinkedInPageScraper):
         """Legacy method name for compatibility."""
         return await super().scrape_page(page, url, fields=fields)
 
+    async def _inner_texts(
+        self, page: Page, selector: str, limit: Optional[int] = None
+    ) -> List[str]:
+        """Get innerText of up to `limit` matches of `selector` in one IPC call."""
+        return await page.locator(selector).evaluate_all(_INNER_TEXTS_JS, limit)
+
     async def _extract_basic_info(self, page: Page, person: Person) -> None:
         """Extract basic info using successful selectors + improvements."""
         try:
@@ -201,27 +238,15 @@ class ProfilePageScraper(LinkedInPageScraper):
             except Exception:
                 header_text = ""
 
-            # Connection count patterns
-            connection_patterns = [
-                r"(\d+(?:,\d+)*)\s+connections?",
-                r"(\d+)\+\s+connections?",
-            ]
-
-            for pattern in connection_patterns:
-                match = re.search(pattern, header_text, re.IGNORECASE)
+            for pattern in _CONNECTION_PATTERNS:
+                match = pattern.search(header_text)
                 if match:
                     count_str = match.group(1).replace(",", "").replace("+", "")
                     person.connection_count = int(count_str)
                     break
 
-            # Follower count patterns
-            follower_patterns = [
-                r"(\d+(?:,\d+)*)\s+followers?",
-                r"(\d+(?:\.\d+)?[kK])\s+followers?",
-            ]
-
-            for pattern in follower_patterns:
-                match = re.search(pattern, header_text, re.IGNORECASE)
+            for pattern in _FOLLOWER_PATTERNS:
+                match = pattern.search(header_text)
                 if match:
                     count_str = match.group(1).replace(",", "")
                     if "k" in count_str.lower():
@@ -248,24 +273,20 @@ class ProfilePageScraper(LinkedInPageScraper):
             # Strategy 2: Quick link check - limit to 5 links for speed
             if not person.website_url:
                 try:
-                    all_links = await page.locator(
+                    hrefs = await page.locator(
                         "a[href*='cloudconsultants'], a[href$='.ch']"
-                    ).all()
-                    for link in all_links[:5]:  # Reduced limit for speed
-                        try:
-                            href = await link.get_attribute("href", timeout=500)
-                            if (
-                                href
-                                and href.startswith("http")
-                                and "linkedin.com" not in href
-                            ):
-                                person.website_url = href
-                                logger.debug(
-                                    f"Extracted website_url from links: {person.website_url}"
-                                )
-                                break
-                        except Exception:
-                            continue
+                    ).evaluate_all(_HREFS_JS, 5)  # Reduced limit for speed
+                    for href in hrefs:
+                        if (
+                            href
+                            and href.startswith("http")
+                            and "linkedin.com" not in href
+                        ):
+                            person.website_url = href
+                            logger.debug(
+                                f"Extracted website_url from links: {person.website_url}"
+                            )
+                            break
                 except Exception:
                     pass
 
@@ -279,12 +300,12 @@ class ProfilePageScraper(LinkedInPageScraper):
             selector = "section:has(#experience) div[data-view-name='profile-component-entity']"
             logger.debug(f"Using experience selector: {selector}")
 
-            experience_items = await page.locator(selector).all()
-            logger.debug(f"Found {len(experience_items)} experience items")
+            experience_texts = await self._inner_texts(page, selector)
+            logger.debug(f"Found {len(experience_texts)} experience items")
 
-            for i, item in enumerate(experience_items):
+            for i, text in enumerate(experience_texts):
                 try:
-                    experience = await self._extract_single_experience(item)
+                    experience = self._parse_single_experience(text)
                     if (
                         experience
                         and experience.position_title
@@ -315,16 +336,14 @@ class ProfilePageScraper(LinkedInPageScraper):
 
             logger.debug(traceback.format_exc())
 
-    async def _extract_single_experience(self, item) -> Optional[Experience]:
-        """Extract a single experience item using improved LinkedIn format parsing."""
+    def _parse_single_experience(self, text: str) -> Optional[Experience]:
+        """Parse a single experience item's text using LinkedIn format parsing."""
         try:
-            # Extract text content
-            text = await item.inner_text()
             if not text or len(text.strip()) == 0:
                 return None
 
             # Parse lines following LinkedIn format
-            lines = [line.strip() for line in text.split("\n") if line.strip()]
+            lines = [line for line in map(str.strip, text.split("\n")) if line]
             if not lines:
                 return None
 
@@ -359,12 +378,12 @@ class ProfilePageScraper(LinkedInPageScraper):
                 date_line = lines[4]
                 # Extract dates
                 if "Present" in date_line:
-                    match = re.search(r"(\w+\s+\d{4})\s*-\s*Present", date_line)
+                    match = _PRESENT_RANGE_RE.search(date_line)
                     if match:
                         from_date = match.group(1)
                         to_date = None  # None indicates "Present"
                 else:
-                    match = re.search(r"(\w+\s+\d{4})\s*-\s*(\w+\s+\d{4})", date_line)
+                    match = _DATE_RANGE_RE.search(date_line)
                     if match:
                         from_date = match.group(1)
                         to_date = match.group(2)
@@ -372,10 +391,7 @@ class ProfilePageScraper(LinkedInPageScraper):
                 # Extract duration
                 if "·" in date_line:
                     duration_part = date_line.split("·")[1].strip()
-                    duration_match = re.search(
-                        r"(\d+\s+yrs?\s+\d+\s+mos?|\d+\s+yrs?|\d+\s+mos?)",
-                        duration_part,
-                    )
+                    duration_match = _DURATION_RE.search(duration_part)
                     if duration_match:
                         duration = duration_match.group(1)
 
@@ -416,12 +432,12 @@ class ProfilePageScraper(LinkedInPageScraper):
             )
             logger.debug(f"Using education selector: {selector}")
 
-            education_items = await page.locator(selector).all()
-            logger.debug(f"Found {len(education_items)} education items")
+            education_texts = await self._inner_texts(page, selector)
+            logger.debug(f"Found {len(education_texts)} education items")
 
-            for i, item in enumerate(education_items):
+            for i, text in enumerate(education_texts):
                 try:
-                    education = await self._extract_single_education(item)
+                    education = self._parse_single_education(text)
                     if education and education.institution_name:
                         person.educations.append(education)
                         logger.debug(
@@ -441,16 +457,14 @@ class ProfilePageScraper(LinkedInPageScraper):
 
             logger.debug(traceback.format_exc())
 
-    async def _extract_single_education(self, item) -> Optional[Education]:
-        """Extract a single education item from a DOM element - EXACT working implementation."""
+    def _parse_single_education(self, text: str) -> Optional[Education]:
+        """Parse a single education item's text - EXACT working implementation."""
         try:
-            # Extract text content
-            text = await item.inner_text()
             if not text or len(text.strip()) == 0:
                 return None
 
             # Simple text-based extraction (could be enhanced with more structured parsing)
-            lines = [line.strip() for line in text.split("\n") if line.strip()]
+            lines = [line for line in map(str.strip, text.split("\n")) if line]
             if not lines:
                 return None
 
@@ -466,8 +480,7 @@ class ProfilePageScraper(LinkedInPageScraper):
             )
 
             # Try to extract dates
-            date_pattern = r"\b\d{4}\b"
-            dates = re.findall(date_pattern, text)
+            dates = _YEAR_RE.findall(text)
             if dates:
                 education.from_date = dates[0] if dates else None
                 education.to_date = dates[-1] if len(dates) > 1 else dates[0]
@@ -482,26 +495,18 @@ class ProfilePageScraper(LinkedInPageScraper):
         """Extract accomplishments using simple selectors."""
         try:
             # Simple honors extraction
-            honors_items = await page.locator(
-                "section:has-text('Honors') li, section:has-text('Awards') li"
-            ).all()
-            for item in honors_items[:5]:
-                try:
-                    text = await item.inner_text()
-                    if text and len(text.strip()) > 0:
-                        person.honors.append(text.strip())
-                except Exception:
-                    continue
+            honors_texts = await self._inner_texts(
+                page,
+                "main section:has-text('Honors') li, main section:has-text('Awards') li",
+                limit=5,
+            )
+            person.honors.extend(text.strip() for text in honors_texts if text.strip())
 
             # Simple languages extraction
-            lang_items = await page.locator("section:has-text('Languages') li").all()
-            for item in lang_items[:5]:
-                try:
-                    text = await item.inner_text()
-                    if text and len(text.strip()) > 0:
-                        person.languages.append(text.strip())
-                except Exception:
-                    continue
+            lang_texts = await self._inner_texts(
+                page, "main section:has-text('Languages') li", limit=5
+            )
+            person.languages.extend(text.strip() for text in lang_texts if text.strip())
 
         except Exception as e:
             logger.debug(f"Accomplishments extraction failed: {e}")
@@ -509,16 +514,14 @@ class ProfilePageScraper(LinkedInPageScraper):
     async def _extract_interests(self, page: Page, person: Person) -> None:
         """Extract interests using simple selectors."""
         try:
-            interest_items = await page.locator(
-                "section:has-text('Interests') li, section:has-text('Following') li"
-            ).all()
-            for item in interest_items[:10]:
-                try:
-                    text = await item.inner_text()
-                    if text and len(text.strip()) > 0:
-                        person.interests.append(text.strip())
-                except Exception:
-                    continue
+            interest_texts = await self._inner_texts(
+                page,
+                "main section:has-text('Interests') li, main section:has-text('Following') li",
+                limit=10,
+            )
+            person.interests.extend(
+                text.strip() for text in interest_texts if text.strip()
+            )
 
         except Exception as e:
             logger.debug(f"Interests extraction failed: {e}")
@@ -119,8 +119,8 @@ class PersonScraper:
 
         try:
             # Basic navigation
-            await self.page.goto(str(linkedin_url))
-            await self.page.wait_for_load_state("networkidle")
+            await self.page.goto(str(linkedin_url), wait_until="domcontentloaded")
+            await self.page.wait_for_selector("h1", state="attached", timeout=10000)
             await random_delay(2.0, 4.0)
 
             # Basic name extraction only (emergency fallback)
@@ -1,5 +1,9 @@
 """High-level LinkedIn scraping session API."""
 
+import logging
+from pathlib import Path
+from typing import Optional
+
 from patchright.async_api import Page
 
 from .auth import CookieAuth, LinkedInAuth, PasswordAuth
@@ -7,19 +11,29 @@ from .browser import BrowserContextManager
 from .config import PersonScrapingFields
 from .models.person import Person
 
+logger = logging.getLogger(__name__)
+
 
 class LinkedInSession:
     """High-level LinkedIn scraping session that manages authentication and browser state."""
 
-    def __init__(self, auth: LinkedInAuth, headless: bool = True):
+    def __init__(
+        self,
+        auth: LinkedInAuth,
+        headless: bool = True,
+        storage_state_path: Optional[str] = None,
+    ):
         """Initialize LinkedIn session parameters.
 
         Args:
             auth: Authentication instance (PasswordAuth, CookieAuth, etc.)
             headless: Whether to run browser in headless mode
+            storage_state_path: Optional file used to persist and restore the
+                authenticated browser storage state across process restarts
         """
         self._auth = auth
         self._headless = headless
+        self._storage_state_path = storage_state_path
         self._browser_session = None
         self._context = None
         self._page = None
@@ -44,18 +58,25 @@ class LinkedInSession:
         return cls(auth, headless=headless)
 
     @classmethod
-    def from_cookie(cls, cookie: str, headless: bool = True) -> "LinkedInSession":
+    def from_cookie(
+        cls,
+        cookie: str,
+        headless: bool = True,
+        storage_state_path: Optional[str] = None,
+    ) -> "LinkedInSession":
         """Convenience method to create session with cookie authentication.
 
         Args:
             cookie: LinkedIn li_at cookie value
             headless: Whether to run browser in headless mode
+            storage_state_path: Optional file used to persist the authenticated
+                storage state so later sessions can skip cookie injection
 
         Returns:
             LinkedInSession instance
         """
         auth = CookieAuth(cookie)
-        return cls(auth, headless=headless)
+        return cls(auth, headless=headless, storage_state_path=storage_state_path)
 
     async def is_authenticated(self) -> bool:
         """Check if session is authenticated with LinkedIn validation.
@@ -74,10 +95,37 @@ class LinkedInSession:
                 timeout=10000,
             )
             # Check if we're actually on LinkedIn (not redirected to login)
-            return "linkedin.com/feed" in self._page.url
+            if "linkedin.com/feed" in self._page.url:
+                return True
         except Exception:
             return False
 
+        # Redirected to login - persisted state holds an expired cookie
+        self._authenticated = False
+        self._invalidate_storage_state()
+        return False
+
+    @property
+    def authenticated(self) -> bool:
+        """Whether the session is logged in, as of its last authentication check."""
+        return self._authenticated
+
+    def _has_storage_state(self) -> bool:
+        """Check whether a persisted storage state is available for reuse."""
+        return bool(
+            self._storage_state_path and Path(self._storage_state_path).exists()
+        )
+
+    def _invalidate_storage_state(self) -> None:
+        """Remove persisted storage state so the next session re-authenticates."""
+        if not self._storage_state_path:
+            return
+        try:
+            Path(self._storage_state_path).unlink(missing_ok=True)
+            logger.info(f"Invalidated storage state at {self._storage_state_path}")
+        except OSError as e:
+            logger.warning(f"Failed to remove storage state: {e}")
+
     async def _ensure_authenticated(self) -> Page:
         """Ensure session is authenticated and return page.
 
@@ -161,18 +209,29 @@ class LinkedInSession:
 
     async def __aenter__(self):
         """Context manager entry - initialize browser and authenticate."""
+        restored = self._has_storage_state()
         try:
             # Disable session warming in context manager - will happen after authentication
             self._browser_session = BrowserContextManager(
                 headless=self._headless,
+                storage_state_path=self._storage_state_path,
                 enable_session_warming=False,  # Critical: warm session AFTER setting cookies
             )
             self._context = await self._browser_session.__aenter__()
-            self._page = await self._auth.login(context=self._context)
+            # Restored storage state already carries the auth cookies
+            self._page = await self._auth.login(
+                context=self._context, customize_context=not restored
+            )
             self._authenticated = True
+
+            # Persist right after first successful auth so restarts can reuse it
+            if not restored:
+                await self._browser_session.save_storage_state()
             return self
         except Exception:
             # Clean up on failure
+            if restored:
+                self._invalidate_storage_state()
             if self._browser_session:
                 await self._browser_session.__aexit__(None, None, None)
             raise
@@ -1,11 +1,12 @@
 """Central control system for all LinkedIn scraping stealth operations."""
 
+import asyncio
 import logging
 import os
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from patchright.async_api import Page
 
@@ -16,6 +17,17 @@ from linkedin_mcp_server.scraper.stealth.profiles import (
 
 logger = logging.getLogger(__name__)
 
+# Strong references to in-flight telemetry tasks; the event loop only keeps
+# weak ones, so unreferenced tasks could be garbage collected mid-write
+_telemetry_tasks: Set[asyncio.Task] = set()
+
+
+def _on_telemetry_done(task: asyncio.Task) -> None:
+    """Release a finished telemetry task and log any failure."""
+    _telemetry_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Telemetry recording failed: {task.exception()}")
+
 
 class PageType(Enum):
     """LinkedIn page types with specific behaviors."""
@@ -58,6 +70,7 @@ class ScrapingResult:
     profile_used: str
     url: str
     error: Optional[str] = None
+    exception: Optional[Exception] = None  # Original failure, for retry decisions
 
 
 class StealthController:
@@ -90,9 +103,15 @@ class StealthController:
         logger.info(f"StealthController initialized with profile: {self.profile.name}")
 
     @classmethod
-    def from_config(cls) -> "StealthController":
-        """Create a StealthController from environment configuration."""
-        profile_name = os.getenv("STEALTH_PROFILE", "MINIMAL_STEALTH")
+    def from_config(cls, profile_name: Optional[str] = None) -> "StealthController":
+        """Create a StealthController from environment configuration.
+
+        Args:
+            profile_name: Profile to use instead of STEALTH_PROFILE; telemetry
+                still follows STEALTH_TELEMETRY
+        """
+        if profile_name is None:
+            profile_name = os.getenv("STEALTH_PROFILE", "MINIMAL_STEALTH")
         telemetry = os.getenv("STEALTH_TELEMETRY", "true").lower() == "true"
 
         profile = get_stealth_profile(profile_name)
@@ -139,7 +158,7 @@ class StealthController:
             duration = time.time() - start_time
 
             if self.telemetry_enabled:
-                await self._record_telemetry(url, duration, True)
+                self._schedule_telemetry(url, duration, True)
 
             logger.info(
                 f"Successfully scraped {page_type.value} in {duration:.1f}s "
@@ -160,7 +179,7 @@ class StealthController:
             logger.error(f"Scraping failed after {duration:.1f}s: {e}")
 
             if self.telemetry_enabled:
-                await self._record_telemetry(url, duration, False, str(e))
+                self._schedule_telemetry(url, duration, False, str(e))
 
             return ScrapingResult(
                 success=False,
@@ -170,6 +189,7 @@ class StealthController:
                 profile_used=self.profile.name,
                 url=url,
                 error=str(e),
+                exception=e,
             )
 
     async def navigate_and_prepare_page(
@@ -249,6 +269,20 @@ class StealthController:
 
         await self.simulator.simulate_page_interaction(page, page_type, self.profile)
 
+    def _schedule_telemetry(
+        self,
+        url: str,
+        duration: float,
+        success: bool,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record telemetry in the background so it stays off the response path."""
+        task = asyncio.create_task(
+            self._record_telemetry(url, duration, success, error)
+        )
+        _telemetry_tasks.add(task)
+        task.add_done_callback(_on_telemetry_done)
+
     async def _record_telemetry(
         self,
         url: str,
@@ -261,10 +295,10 @@ class StealthController:
         if not self.telemetry_enabled:
             return
 
-        from linkedin_mcp_server.scraper.stealth.telemetry import PerformanceTelemetry
+        from linkedin_mcp_server.scraper.stealth.telemetry import get_shared_telemetry
 
         if not self.telemetry:
-            self.telemetry = PerformanceTelemetry()
+            self.telemetry = get_shared_telemetry()
 
         if success:
             await self.telemetry.record_success(url, duration, self.profile.name)
@@ -3,7 +3,7 @@
 import logging
 import random
 import re
-from typing import Optional
+from typing import Dict, Optional
 from urllib.parse import parse_qs, urlparse
 
 from patchright.async_api import Page
@@ -22,6 +22,13 @@ class NavigationStrategy:
     stealth profile, enabling fast direct navigation or slow search-first patterns.
     """
 
+    # Element that signals the fields we read have rendered, awaited after
+    # domcontentloaded instead of waiting for network idle
+    READY_SELECTORS: Dict[PageType, str] = {
+        PageType.PROFILE: "main h1",
+    }
+    READY_TIMEOUT_MS = 10000
+
     def __init__(self, mode: NavigationMode):
         """Initialize navigation strategy.
 
@@ -66,8 +73,27 @@ class NavigationStrategy:
         if await self._detect_linkedin_challenge(page):
             raise LinkedInDetectionError("Challenge detected after navigation")
 
+        await self._wait_until_ready(page, page_type)
+
         logger.debug(f"Successfully navigated to {url}")
 
+    async def _wait_until_ready(self, page: Page, page_type: PageType) -> None:
+        """Wait for the page type's ready selector to be attached.
+
+        A timeout is logged rather than raised so extraction can still pick up
+        whatever has rendered.
+        """
+        selector = self.READY_SELECTORS.get(page_type)
+        if not selector:
+            return
+
+        try:
+            await page.wait_for_selector(
+                selector, state="attached", timeout=self.READY_TIMEOUT_MS
+            )
+        except Exception as e:
+            logger.debug(f"Ready selector {selector} not found: {e}")
+
     async def _navigate_direct(
         self,
         page: Page,
@@ -99,7 +125,7 @@ class NavigationStrategy:
 
         except Exception as e:
             logger.error(f"Direct navigation failed: {e}")
-            raise LinkedInDetectionError(f"Navigation failed: {e}")
+            raise LinkedInDetectionError(f"Navigation failed: {e}") from e
 
     async def _navigate_search_first(
         self,
@@ -210,7 +236,7 @@ class NavigationStrategy:
             if isinstance(e, LinkedInDetectionError):
                 raise
             logger.error(f"Search-first navigation failed: {e}")
-            raise LinkedInDetectionError(f"Navigation failed: {e}")
+            raise LinkedInDetectionError(f"Navigation failed: {e}") from e
 
     async def _simulate_typing(
         self,
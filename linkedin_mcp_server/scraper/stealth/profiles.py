@@ -1,5 +1,6 @@
 """Stealth profile configurations for different performance/detection trade-offs."""
 
+import functools
 import os
 from dataclasses import dataclass
 from enum import Enum
@@ -24,7 +25,7 @@ class SimulationLevel(Enum):
     COMPREHENSIVE = "comprehensive"  # Full behavior simulation (current default)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DelayConfig:
     """Centralized delay configurations for stealth operations."""
 
@@ -35,9 +36,13 @@ class DelayConfig:
     scroll: Tuple[float, float] = (0.5, 1.5)  # Scroll action delays
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StealthProfile:
-    """Configurable stealth behavior profiles for different use cases."""
+    """Configurable stealth behavior profiles for different use cases.
+
+    Profiles are immutable, so each preset factory builds its profile once
+    and returns the same instance on every call.
+    """
 
     name: str
     navigation: NavigationMode
@@ -52,6 +57,7 @@ class StealthProfile:
     session_rotation_threshold: int = 5
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def NO_STEALTH(cls) -> "StealthProfile":
         """Maximum speed profile with minimal stealth (50s target)."""
         return cls(
@@ -75,6 +81,7 @@ class StealthProfile:
         )
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def MINIMAL_STEALTH(cls) -> "StealthProfile":
         """Balanced profile for production use (75s target)."""
         return cls(
@@ -98,6 +105,7 @@ class StealthProfile:
         )
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def MODERATE_STEALTH(cls) -> "StealthProfile":
         """Moderate stealth with good performance (150s target)."""
         return cls(
@@ -121,6 +129,7 @@ class StealthProfile:
         )
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def MAXIMUM_STEALTH(cls) -> "StealthProfile":
         """Maximum stealth profile matching current system (295s)."""
         return cls(
@@ -176,6 +185,12 @@ def get_stealth_profile(
     if profile_name is None:
         profile_name = os.getenv("STEALTH_PROFILE", "MINIMAL_STEALTH")
 
+    return _profile_for_name(profile_name.upper())
+
+
+@functools.lru_cache(maxsize=4)
+def _profile_for_name(profile_name: str) -> StealthProfile:
+    """Resolve an upper-cased profile name; unknown names raise and are not cached."""
     # Map profile names to factory methods
     profile_map = {
         "NO_STEALTH": StealthProfile.NO_STEALTH,
@@ -184,7 +199,6 @@ def get_stealth_profile(
         "MAXIMUM_STEALTH": StealthProfile.MAXIMUM_STEALTH,
     }
 
-    profile_name = profile_name.upper()
     if profile_name not in profile_map:
         raise ValueError(
             f"Unknown stealth profile: {profile_name}. "
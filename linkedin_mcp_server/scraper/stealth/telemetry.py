@@ -359,10 +359,9 @@ class PerformanceTelemetry:
                 "last_updated": time.time(),
             }
 
-            # Write atomically
+            # Serialize in memory, then write atomically in a single call
             temp_file = self.metrics_file.with_suffix(".tmp")
-            with temp_file.open("w") as f:
-                json.dump(data, f, indent=2)
+            temp_file.write_text(json.dumps(data, indent=2))
             temp_file.replace(self.metrics_file)
 
         except Exception as e:
@@ -421,3 +420,23 @@ class PerformanceTelemetry:
                 logger.warning(f"Failed to delete metrics file: {e}")
 
         logger.info("All metrics data cleared")
+
+
+_shared_telemetry: Optional[PerformanceTelemetry] = None
+
+
+def get_shared_telemetry() -> PerformanceTelemetry:
+    """Get the process-wide telemetry instance, creating it on first use.
+
+    Construction loads the metrics file from disk, so controllers share one
+    instance instead of each building their own.
+
+    Returns:
+        Shared PerformanceTelemetry instance
+    """
+    global _shared_telemetry
+
+    # Construction never awaits, so this is atomic on the event loop
+    if _shared_telemetry is None:
+        _shared_telemetry = PerformanceTelemetry()
+    return _shared_telemetry
@@ -8,20 +8,35 @@ Provides clean shutdown handling and resource cleanup.
 """
 
 import logging
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
 
 from fastmcp import FastMCP
 
+from linkedin_mcp_server.tools._browser_pool import close_browser
 from linkedin_mcp_server.tools.company import register_company_tools
 from linkedin_mcp_server.tools.job import register_job_tools
-from linkedin_mcp_server.tools.person import register_person_tools
+from linkedin_mcp_server.tools.person import (
+    clear_profile_cache,
+    register_person_tools,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def server_lifespan(mcp: FastMCP) -> AsyncIterator[None]:
+    """Close the shared browser inside the server's event loop on shutdown."""
+    try:
+        yield
+    finally:
+        await close_browser()
+        logger.info("Shared browser closed")
+
+
 def create_mcp_server() -> FastMCP:
     """Create and configure the MCP server with all LinkedIn tools."""
-    mcp = FastMCP("linkedin_scraper")
+    mcp = FastMCP("linkedin_scraper", lifespan=server_lifespan)
 
     # Register all tools
     register_person_tools(mcp)
@@ -36,6 +51,9 @@ def create_mcp_server() -> FastMCP:
 
         try:
             await PlaywrightSessionManager.close_all_sessions()
+            # The person tools scrape on the shared browser, not the sessions
+            await close_browser()
+            clear_profile_cache()
             return {
                 "status": "success",
                 "message": "Successfully closed the browser session and cleaned up resources",
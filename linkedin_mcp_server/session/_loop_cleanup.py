@@ -0,0 +1,57 @@
+# linkedin_mcp_server/session/_loop_cleanup.py
+"""
+Shutdown of Playwright state left behind by a previous event loop.
+
+Playwright objects can only be driven from the loop that created them. When a
+loop-bound registry resets for a new loop, its old browsers and sessions are
+closed on their own loop instead of being dropped with a live browser behind
+them.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Coroutine, Set
+
+logger = logging.getLogger(__name__)
+
+# Strong references to in-flight cleanups; the event loop only keeps weak ones
+_cleanup_tasks: Set[asyncio.Task] = set()
+
+
+def close_on_owner_loop(
+    owner: asyncio.AbstractEventLoop,
+    close: Callable[[], Coroutine[Any, Any, None]],
+    what: str,
+) -> None:
+    """
+    Schedule a shutdown of objects owned by another event loop.
+
+    Args:
+        owner: Loop the objects were created on
+        close: Factory for the shutdown coroutine, only called if owner can run it
+        what: Description of the objects for log messages
+    """
+    task = asyncio.get_running_loop().create_task(_close_on(owner, close, what))
+    _cleanup_tasks.add(task)
+    task.add_done_callback(_cleanup_tasks.discard)
+
+
+async def _close_on(
+    owner: asyncio.AbstractEventLoop,
+    close: Callable[[], Coroutine[Any, Any, None]],
+    what: str,
+) -> None:
+    """Run close() on a loop running in another thread, or drive a stopped one."""
+    if owner.is_closed():
+        # Nothing can drive the old objects; the Playwright driver exits, taking
+        # its browser along, once its pipe is released with them
+        logger.warning(f"Event loop closed before its {what} was shut down")
+        return
+
+    try:
+        if owner.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(close(), owner))
+        else:
+            await asyncio.to_thread(owner.run_until_complete, close())
+    except Exception as e:
+        logger.warning(f"Failed to close {what} from previous event loop: {e}")
@@ -6,38 +6,75 @@ Provides persistent LinkedIn sessions across multiple tool calls with proper
 cleanup, thread-safe session creation, and authentication management.
 """
 
+import asyncio
+import hashlib
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Dict, List, Optional
 
 from linkedin_mcp_server.scraper.session import LinkedInSession
 from linkedin_mcp_server.debug import get_debug_logger
+from linkedin_mcp_server.session._loop_cleanup import close_on_owner_loop
 
 logger = logging.getLogger(__name__)
 
 
 class PlaywrightSessionManager:
     """
-    Simplified session manager without singleton pattern to avoid asyncio conflicts.
+    Session manager that reuses one LinkedIn session per authentication cookie.
 
-    Creates sessions on-demand within the MCP server's event loop context,
-    avoiding cross-loop asyncio conflicts that cause TaskGroup errors.
+    Sessions and their locks are bound to the event loop that created them;
+    the registry resets itself when accessed from a different loop, avoiding
+    cross-loop asyncio conflicts that cause TaskGroup errors. The sessions it
+    drops are closed on their own loop. A session whose authentication check
+    failed is closed and replaced on its next lookup.
     """
 
+    _sessions: ClassVar[Dict[str, LinkedInSession]] = {}
+    _session_locks: ClassVar[Dict[str, asyncio.Lock]] = {}
+    _registry_lock: ClassVar[Optional[asyncio.Lock]] = None
+    _registry_loop: ClassVar[Optional[asyncio.AbstractEventLoop]] = None
+
+    @classmethod
+    def _get_registry_lock(cls) -> asyncio.Lock:
+        """Get the lock guarding per-session lock creation for the running loop."""
+        loop = asyncio.get_running_loop()
+        # No await between check and assignment, so this is atomic on the loop
+        if cls._registry_lock is None or cls._registry_loop is not loop:
+            if cls._registry_loop is not None and cls._sessions:
+                sessions = list(cls._sessions.values())
+                close_on_owner_loop(
+                    cls._registry_loop,
+                    lambda: cls._close_sessions(sessions),
+                    "LinkedIn sessions",
+                )
+            cls._registry_lock = asyncio.Lock()
+            cls._registry_loop = loop
+            cls._sessions = {}
+            cls._session_locks = {}
+        return cls._registry_lock
+
     @classmethod
     def _get_storage_state_path(cls, session_id: str = "default") -> str:
         """Get storage state file path for session."""
-        # Store in user's cache directory or temp
+        # Store in user's cache directory; the state holds the live li_at
+        # cookie, so the directory is private to the user
         cache_dir = Path.home() / ".cache" / "linkedin-mcp-server"
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        cache_dir.chmod(0o700)
         return str(cache_dir / f"session_{session_id}.json")
 
+    @classmethod
+    def _session_id_for_cookie(cls, authentication: str) -> str:
+        """Derive a stable, non-reversible session id from the auth cookie."""
+        return hashlib.sha256(authentication.encode()).hexdigest()[:16]
+
     @classmethod
     async def create_session(
         cls, authentication: str, headless: bool = True
     ) -> LinkedInSession:
         """
-        Create a new session without singleton storage to avoid asyncio conflicts.
+        Create a new session without registering it for reuse.
 
         Args:
             authentication: LinkedIn session cookie (li_at=value format)
@@ -55,8 +92,17 @@ class PlaywrightSessionManager:
             logger.info("Creating new LinkedIn session...")
             debug_logger.log_session_event("CREATING_NEW", "temp")
 
-            # Create session (no singleton storage to avoid asyncio conflicts)
-            session = LinkedInSession.from_cookie(authentication, headless=headless)
+            # Persisted storage state lets warm restarts skip cookie injection
+            storage_state_path = cls._get_storage_state_path(
+                cls._session_id_for_cookie(authentication)
+            )
+
+            # Create session (registration is left to get_or_create_session)
+            session = LinkedInSession.from_cookie(
+                authentication,
+                headless=headless,
+                storage_state_path=storage_state_path,
+            )
             await session.__aenter__()
 
             logger.info("Created and authenticated new LinkedIn session")
@@ -72,41 +118,78 @@ class PlaywrightSessionManager:
         cls, authentication: str, headless: bool = True
     ) -> LinkedInSession:
         """
-        Backward compatibility method - delegates to create_session.
+        Get the existing session for this cookie or create a new one.
+
+        Concurrent callers with the same cookie share one creation, so only a
+        single browser context is ever launched per cookie.
 
         Args:
             authentication: LinkedIn session cookie (li_at=value format)
             headless: Whether to run browser in headless mode
 
         Returns:
-            LinkedInSession: New authenticated session
+            LinkedInSession: Authenticated session
 
         Raises:
             Exception: If session creation or authentication fails
         """
-        return await cls.create_session(authentication, headless)
+        session_id = cls._session_id_for_cookie(authentication)
+
+        async with cls._get_registry_lock():
+            lock = cls._session_locks.setdefault(session_id, asyncio.Lock())
+
+        async with lock:
+            session = cls._sessions.get(session_id)
+            if session is not None and session.authenticated:
+                get_debug_logger().log_session_event("REUSED", session_id)
+                return session
+
+            if session is not None:
+                # LinkedIn rejected the session; drop it before creating a new one
+                logger.warning("Registered LinkedIn session lost authentication")
+                get_debug_logger().log_session_event("EVICTED", session_id)
+                del cls._sessions[session_id]
+                await cls._close_sessions([session])
+
+            session = await cls.create_session(authentication, headless)
+            cls._sessions[session_id] = session
+            return session
 
     @classmethod
     async def close_all_sessions(cls) -> None:
-        """Placeholder for backward compatibility - no sessions to close."""
-        logger.info("No persistent sessions to close (using on-demand sessions)")
+        """Close every registered session and clear the registry."""
+        sessions = list(cls._sessions.values())
+        cls._sessions = {}
+        cls._session_locks = {}
+
+        await cls._close_sessions(sessions)
+        logger.info(f"Closed {len(sessions)} LinkedIn session(s)")
+
+    @staticmethod
+    async def _close_sessions(sessions: List[LinkedInSession]) -> None:
+        """Close sessions, logging instead of raising on failure."""
+        for session in sessions:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"Failed to close LinkedIn session: {e}")
 
     @classmethod
     async def get_active_session(cls) -> Optional[LinkedInSession]:
         """
-        No active sessions in simplified manager.
+        Get any registered session.
 
         Returns:
-            None: Always returns None since we don't store sessions
+            Optional[LinkedInSession]: A registered session, or None if there is none
         """
-        return None
+        return next(iter(cls._sessions.values()), None)
 
     @classmethod
     def has_active_session(cls) -> bool:
         """
-        No active sessions in simplified manager.
+        Check whether any session is registered.
 
         Returns:
-            False: Always returns False since we don't store sessions
+            bool: True if at least one session is registered
         """
-        return False
+        return bool(cls._sessions)
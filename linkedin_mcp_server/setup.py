@@ -7,6 +7,7 @@ with multiple authentication methods including cookie input and credential-based
 Provides temporary driver management and comprehensive retry logic.
 """
 
+import asyncio
 import logging
 from contextlib import contextmanager
 from typing import Dict, Iterator
@@ -26,10 +27,13 @@ from linkedin_mcp_server.exceptions import CredentialsNotFoundError
 logger = logging.getLogger(__name__)
 
 
-def get_credentials_for_setup() -> Dict[str, str]:
+async def get_credentials_for_setup() -> Dict[str, str]:
     """
     Get LinkedIn credentials for setup purposes.
 
+    Keyring access runs in a worker thread since some backends block for
+    hundreds of milliseconds.
+
     Returns:
         Dict[str, str]: Dictionary with email and password
 
@@ -44,7 +48,7 @@ def get_credentials_for_setup() -> Dict[str, str]:
         return {"email": config.linkedin.email, "password": config.linkedin.password}
 
     # Second, try keyring
-    credentials = get_credentials_from_keyring()
+    credentials = await asyncio.to_thread(get_credentials_from_keyring)
     if credentials["email"] and credentials["password"]:
         logger.info("Using LinkedIn credentials from keyring")
         return {"email": credentials["email"], "password": credentials["password"]}
@@ -54,10 +58,10 @@ def get_credentials_for_setup() -> Dict[str, str]:
         raise CredentialsNotFoundError(ErrorMessages.no_credentials_found())
 
     # Otherwise, prompt for credentials
-    return prompt_for_credentials()
+    return await prompt_for_credentials()
 
 
-def prompt_for_credentials() -> Dict[str, str]:
+async def prompt_for_credentials() -> Dict[str, str]:
     """
     Prompt user for LinkedIn credentials.
 
@@ -78,7 +82,9 @@ def prompt_for_credentials() -> Dict[str, str]:
         raise KeyboardInterrupt("Credential input was cancelled")
 
     # Store credentials securely in keyring
-    if save_credentials_to_keyring(credentials["email"], credentials["password"]):
+    if await asyncio.to_thread(
+        save_credentials_to_keyring, credentials["email"], credentials["password"]
+    ):
         logger.info(InfoMessages.credentials_stored_securely())
     else:
         logger.warning(InfoMessages.keyring_storage_failed())
@@ -262,7 +268,7 @@ async def run_interactive_setup() -> str:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                credentials = get_credentials_for_setup()
+                credentials = await get_credentials_for_setup()
 
                 print("🔑 Logging in to capture session cookie...")
                 cookie = await capture_cookie_from_credentials(
@@ -290,7 +296,7 @@ async def run_interactive_setup() -> str:
                         clear_credentials_from_keyring,
                     )
 
-                    clear_credentials_from_keyring()
+                    await asyncio.to_thread(clear_credentials_from_keyring)
                 else:
                     raise Exception(f"Setup failed after {max_retries} attempts")
 
@@ -314,7 +320,7 @@ async def run_cookie_extraction_setup() -> str:
     print("🔗 LinkedIn MCP Server - Cookie Extraction")
 
     # Get credentials
-    credentials: Dict[str, str] = get_credentials_for_setup()
+    credentials: Dict[str, str] = await get_credentials_for_setup()
 
     # Capture cookie
     cookie: str = await capture_cookie_from_credentials(
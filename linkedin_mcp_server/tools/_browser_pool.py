@@ -0,0 +1,319 @@
+# linkedin_mcp_server/tools/_browser_pool.py
+"""
+Shared Playwright browser for LinkedIn tools.
+
+Keeps one Playwright driver and one Chrome browser (bundled Chromium when
+Chrome is not installed) alive for the life of the MCP server so tool calls
+only pay for a new page, not a browser cold start. Authenticated contexts are
+cached per cookie so LinkedIn's cookies, local storage and HTTP cache stay
+warm between calls, and a few pages per context are kept open between scrapes.
+A context is evicted once LinkedIn shows it a login wall. State is bound to
+the event loop that created it; accessed from a different loop it is replaced
+and the old browser is closed on its own loop.
+"""
+
+import asyncio
+import functools
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from patchright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Route,
+    async_playwright,
+)
+from patchright.async_api import Error as PlaywrightError
+
+from linkedin_mcp_server.session._loop_cleanup import close_on_owner_loop
+from linkedin_mcp_server.session.manager import PlaywrightSessionManager
+
+logger = logging.getLogger(__name__)
+
+# Persist each cached context's storage state every N context checkouts
+STORAGE_STATE_SAVE_INTERVAL = 10
+
+# Idle pages kept per context after a successful scrape. They are left on a
+# linkedin.com page, so the next profile navigation is same-origin
+PAGE_POOL_SIZE = 2
+# Retire a pooled page after this many scrapes to bound per-page memory
+PAGE_MAX_USES = 25
+
+# Paths LinkedIn redirects to when a session is logged out or its cookie expired
+AUTH_WALL_PATHS = ("/login", "/authwall", "/uas/login")
+
+# Resources the scrapers never read. Stylesheets stay allowed: extraction relies
+# on innerText, which depends on layout (e.g. LinkedIn's visually-hidden spans).
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_URL_FRAGMENTS = (
+    "doubleclick.net",
+    "google-analytics.com",
+    "px.ads.linkedin.com",
+)
+
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_contexts: Dict[str, BrowserContext] = {}
+_context_uses: Dict[str, int] = {}
+_idle_pages: Dict[BrowserContext, List[Tuple[Page, int]]] = {}
+_lock: Optional[asyncio.Lock] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_lock() -> asyncio.Lock:
+    """Get the lock guarding browser and context startup for the running loop."""
+    global _playwright, _browser, _contexts, _context_uses, _idle_pages, _lock, _loop
+
+    loop = asyncio.get_running_loop()
+    # No await between check and assignment, so this is atomic on the loop
+    if _lock is None or _loop is not loop:
+        if _loop is not None and (_browser is not None or _playwright is not None):
+            close_on_owner_loop(
+                _loop,
+                functools.partial(_shutdown, _browser, _playwright, _contexts),
+                "shared browser",
+            )
+        _lock = asyncio.Lock()
+        _loop = loop
+        _playwright = None
+        _browser = None
+        _contexts = {}
+        _context_uses = {}
+        _idle_pages = {}
+    return _lock
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for media and trackers, let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        fragment in request.url for fragment in BLOCKED_URL_FRAGMENTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _ensure_browser() -> Browser:
+    """Launch the shared browser if needed. Caller must hold the lock."""
+    global _playwright, _browser, _contexts, _context_uses, _idle_pages
+
+    if _browser is not None and _browser.is_connected():
+        return _browser
+
+    if _playwright is None:
+        logger.info("Starting shared Playwright driver")
+        _playwright = await async_playwright().start()
+
+    logger.info("Launching shared Chrome browser")
+    try:
+        _browser = await _playwright.chromium.launch(headless=True, channel="chrome")
+    except PlaywrightError as e:
+        logger.warning(f"Chrome unavailable, using bundled Chromium instead: {e}")
+        _browser = await _playwright.chromium.launch(headless=True)
+    # Contexts of a previous browser died with it
+    _contexts = {}
+    _context_uses = {}
+    _idle_pages = {}
+    return _browser
+
+
+async def get_browser() -> Browser:
+    """
+    Get the shared browser, launching it on first use.
+
+    Returns:
+        Browser: Connected Chrome browser instance
+
+    Raises:
+        Exception: If Playwright or the browser fails to start
+    """
+    async with _get_lock():
+        return await _ensure_browser()
+
+
+async def get_context(cookie: str) -> BrowserContext:
+    """
+    Get the cached authenticated context for a li_at cookie.
+
+    The first call restores persisted storage state when available, otherwise
+    injects the cookie. Callers open and close their own pages on the context.
+
+    Args:
+        cookie: LinkedIn li_at cookie value
+
+    Returns:
+        BrowserContext: Long-lived context authenticated with the cookie
+
+    Raises:
+        Exception: If the browser or context cannot be created
+    """
+    session_id = PlaywrightSessionManager._session_id_for_cookie(cookie)
+
+    async with _get_lock():
+        browser = await _ensure_browser()
+        context = _contexts.get(session_id)
+
+        if context is None:
+            state_path = PlaywrightSessionManager._get_storage_state_path(session_id)
+            if Path(state_path).exists():
+                logger.info(f"Restoring context storage state from {state_path}")
+                context = await browser.new_context(storage_state=state_path)
+            else:
+                context = await browser.new_context()
+                await context.add_cookies(
+                    [
+                        {
+                            "name": "li_at",
+                            "value": cookie,
+                            "domain": ".linkedin.com",
+                            "path": "/",
+                        }
+                    ]
+                )
+            await context.route("**/*", _block_heavy_resources)
+            _contexts[session_id] = context
+            _context_uses[session_id] = 0
+
+        _context_uses[session_id] += 1
+        if _context_uses[session_id] % STORAGE_STATE_SAVE_INTERVAL == 0:
+            await _save_storage_state(session_id, context)
+
+        return context
+
+
+async def checkout_page(context: BrowserContext) -> Tuple[Page, int]:
+    """
+    Take an idle page of a context, or open a new one if none is left.
+
+    Args:
+        context: Context returned by get_context
+
+    Returns:
+        Tuple[Page, int]: The page and how many scrapes it has already served
+    """
+    idle = _idle_pages.get(context)
+    while idle:
+        page, uses = idle.pop()
+        if not page.is_closed():
+            return page, uses
+    return await context.new_page(), 0
+
+
+def park_page(context: BrowserContext, page: Page, uses: int) -> bool:
+    """
+    Keep a page open for the next checkout of its context.
+
+    Pages of contexts no longer cached, pages past PAGE_MAX_USES and pages
+    beyond PAGE_POOL_SIZE are refused; the caller closes those.
+
+    Args:
+        context: Context the page belongs to
+        page: Page that finished a scrape successfully
+        uses: Scrapes the page has served, including the one just finished
+
+    Returns:
+        bool: True if the page was parked, False if the caller should close it
+    """
+    if context not in _contexts.values():
+        return False
+    if uses >= PAGE_MAX_USES or page.is_closed():
+        return False
+
+    idle = _idle_pages.setdefault(context, [])
+    if len(idle) >= PAGE_POOL_SIZE:
+        return False
+    idle.append((page, uses))
+    return True
+
+
+async def _save_storage_state(session_id: str, context: BrowserContext) -> None:
+    """Persist a context's storage state, logging instead of raising on failure."""
+    try:
+        state_path = PlaywrightSessionManager._get_storage_state_path(session_id)
+        await context.storage_state(path=state_path)
+        # The state holds the li_at cookie; keep it readable by the user only
+        Path(state_path).chmod(0o600)
+    except Exception as e:
+        logger.warning(f"Failed to save context storage state: {e}")
+
+
+def is_auth_wall(url: str) -> bool:
+    """Check whether a page URL is LinkedIn's login or auth wall."""
+    parsed = urlparse(url)
+    return parsed.netloc.endswith("linkedin.com") and parsed.path.startswith(
+        AUTH_WALL_PATHS
+    )
+
+
+async def evict_context(cookie: str) -> None:
+    """
+    Drop the cached context for a cookie whose session LinkedIn rejected.
+
+    The persisted storage state is deleted too, so the next get_context starts
+    over from the cookie instead of restoring the logged-out state.
+
+    Args:
+        cookie: LinkedIn li_at cookie value
+    """
+    session_id = PlaywrightSessionManager._session_id_for_cookie(cookie)
+
+    async with _get_lock():
+        context = _contexts.pop(session_id, None)
+        _context_uses.pop(session_id, None)
+        if context is not None:
+            _idle_pages.pop(context, None)
+
+    logger.warning("LinkedIn session rejected, evicting cached browser context")
+    try:
+        Path(PlaywrightSessionManager._get_storage_state_path(session_id)).unlink(
+            missing_ok=True
+        )
+    except OSError as e:
+        logger.warning(f"Failed to remove context storage state: {e}")
+
+    if context is not None:
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Context close error (non-critical): {e}")
+
+
+async def _shutdown(
+    browser: Optional[Browser],
+    playwright: Optional[Playwright],
+    contexts: Dict[str, BrowserContext],
+) -> None:
+    """Persist context state, close a browser and stop its Playwright driver."""
+    for session_id, context in contexts.items():
+        await _save_storage_state(session_id, context)
+
+    if browser is not None:
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.debug(f"Browser close error (non-critical): {e}")
+
+    if playwright is not None:
+        try:
+            await playwright.stop()
+        except Exception as e:
+            logger.debug(f"Playwright stop error (non-critical): {e}")
+
+
+async def close_browser() -> None:
+    """Persist context state, close the shared browser and stop Playwright."""
+    global _playwright, _browser, _contexts, _context_uses, _idle_pages
+
+    browser, playwright, contexts = _browser, _playwright, _contexts
+    _browser = None
+    _playwright = None
+    _contexts = {}
+    _context_uses = {}
+    _idle_pages = {}
+
+    await _shutdown(browser, playwright, contexts)
@@ -7,12 +7,23 @@ insights from LinkedIn with configurable depth and comprehensive error handling.
 """
 
 import logging
+from types import MappingProxyType
 from typing import Any, Dict
 
 from fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
 
+# Read-only response template for the disabled company tool
+_FEATURE_UNAVAILABLE_COMPANY = MappingProxyType(
+    {
+        "error": "feature_not_available",
+        "message": "Company profile scraping is temporarily unavailable during migration to Playwright",
+        "resolution": "Use person profile tools instead, or wait for future release with company support",
+        "status": "migration_in_progress",
+    }
+)
+
 
 def register_company_tools(mcp: FastMCP) -> None:
     """
@@ -42,10 +53,4 @@ def register_company_tools(mcp: FastMCP) -> None:
         logger.warning(
             "Company profile scraping temporarily unavailable during Playwright migration"
         )
-        return {
-            "error": "feature_not_available",
-            "message": "Company profile scraping is temporarily unavailable during migration to Playwright",
-            "resolution": "Use person profile tools instead, or wait for future release with company support",
-            "requested_company": company_name,
-            "status": "migration_in_progress",
-        }
+        return {**_FEATURE_UNAVAILABLE_COMPANY, "requested_company": company_name}
@@ -7,12 +7,43 @@ with comprehensive filtering and structured data extraction.
 """
 
 import logging
+from types import MappingProxyType
 from typing import Any, Dict, List
 
 from fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
 
+_JOB_RESOLUTION = (
+    "Use person profile tools instead, or wait for future release with job support"
+)
+
+# Read-only response templates for the disabled job tools
+_FEATURE_UNAVAILABLE_JOB_DETAILS = MappingProxyType(
+    {
+        "error": "feature_not_available",
+        "message": "Job details scraping is temporarily unavailable during migration to Playwright",
+        "resolution": _JOB_RESOLUTION,
+        "status": "migration_in_progress",
+    }
+)
+_FEATURE_UNAVAILABLE_JOB_SEARCH = MappingProxyType(
+    {
+        "error": "feature_not_available",
+        "message": "Job search is temporarily unavailable during migration to Playwright",
+        "resolution": _JOB_RESOLUTION,
+        "status": "migration_in_progress",
+    }
+)
+_FEATURE_UNAVAILABLE_RECOMMENDED_JOBS = MappingProxyType(
+    {
+        "error": "feature_not_available",
+        "message": "Recommended jobs are temporarily unavailable during migration to Playwright",
+        "resolution": _JOB_RESOLUTION,
+        "status": "migration_in_progress",
+    }
+)
+
 
 def register_job_tools(mcp: FastMCP) -> None:
     """
@@ -39,13 +70,7 @@ def register_job_tools(mcp: FastMCP) -> None:
         logger.warning(
             "Job details scraping temporarily unavailable during Playwright migration"
         )
-        return {
-            "error": "feature_not_available",
-            "message": "Job details scraping is temporarily unavailable during migration to Playwright",
-            "resolution": "Use person profile tools instead, or wait for future release with job support",
-            "requested_job_id": job_id,
-            "status": "migration_in_progress",
-        }
+        return {**_FEATURE_UNAVAILABLE_JOB_DETAILS, "requested_job_id": job_id}
 
     @mcp.tool()
     async def search_jobs(search_term: str) -> List[Dict[str, Any]]:
@@ -59,15 +84,7 @@ def register_job_tools(mcp: FastMCP) -> None:
             List[Dict[str, Any]]: Error response indicating feature not available
         """
         logger.warning("Job search temporarily unavailable during Playwright migration")
-        return [
-            {
-                "error": "feature_not_available",
-                "message": "Job search is temporarily unavailable during migration to Playwright",
-                "resolution": "Use person profile tools instead, or wait for future release with job support",
-                "search_term": search_term,
-                "status": "migration_in_progress",
-            }
-        ]
+        return [{**_FEATURE_UNAVAILABLE_JOB_SEARCH, "search_term": search_term}]
 
     @mcp.tool()
     async def get_recommended_jobs() -> List[Dict[str, Any]]:
@@ -80,11 +97,4 @@ def register_job_tools(mcp: FastMCP) -> None:
         logger.warning(
             "Recommended jobs temporarily unavailable during Playwright migration"
         )
-        return [
-            {
-                "error": "feature_not_available",
-                "message": "Recommended jobs are temporarily unavailable during migration to Playwright",
-                "resolution": "Use person profile tools instead, or wait for future release with job support",
-                "status": "migration_in_progress",
-            }
-        ]
+        return [dict(_FEATURE_UNAVAILABLE_RECOMMENDED_JOBS)]
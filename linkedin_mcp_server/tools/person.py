@@ -5,112 +5,320 @@ LinkedIn person profile scraping tools with Playwright-based dual scraping modes
 Provides MCP tools for extracting LinkedIn profile information with two modes:
 - get_person_profile_minimal: Fast basic info scraping (~2-5 seconds)
 - get_person_profile: Comprehensive profile scraping (~30 seconds)
+- get_person_profiles: Batch variant running either mode concurrently
 
 Maintains exact compatibility with existing output format while using modern
 Playwright automation for improved performance and reliability.
 """
 
+import asyncio
+import copy
 import logging
+import os
 import time
-from typing import Any, Dict
+from collections import OrderedDict
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
+from patchright.async_api import Error as PlaywrightError
+from patchright.async_api import Page
 
 from linkedin_mcp_server.error_handler import handle_tool_error
+from linkedin_mcp_server.scraper.config import PersonScrapingFields
+from linkedin_mcp_server.scraper.exceptions import InvalidCredentialsError
+from linkedin_mcp_server.scraper.pages.profile_page import (
+    ProfilePageScraper,
+    SectionCallback,
+)
+from linkedin_mcp_server.scraper.stealth.controller import StealthController
+from linkedin_mcp_server.session.manager import PlaywrightSessionManager
+from linkedin_mcp_server.tools._browser_pool import (
+    checkout_page,
+    evict_context,
+    get_context,
+    is_auth_wall,
+    park_page,
+)
 
 logger = logging.getLogger(__name__)
 
-
-async def get_person_profile_minimal(linkedin_username: str) -> Dict[str, Any]:
+# Default cap on concurrently scraped profiles, override with LINKEDIN_MAX_CONCURRENCY
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Person fields populated by a MINIMAL scrape; the list sections stay empty, so
+# the minimal tool skips serializing them
+MINIMAL_RESPONSE_FIELDS = frozenset(
+    {
+        "linkedin_url",
+        "name",
+        "headline",
+        "location",
+        "about",
+        "company",
+        "job_title",
+        "open_to_work",
+        "connection_count",
+        "followers_count",
+        "website_url",
+        "scraping_errors",
+    }
+)
+
+# Scrape attempts per call; transient Playwright failures retry on a fresh page
+SCRAPE_ATTEMPTS = 2
+
+# Seconds to wait for a page to close before abandoning it to the context
+PAGE_CLOSE_TIMEOUT = 5
+
+# Stealth profile is passed explicitly instead of mutating process-wide env,
+# which raced between concurrent tool calls
+STEALTH_PROFILE_NAME = "NO_STEALTH"
+
+# The scraper keeps no per-call state, so one instance serves all tool calls
+_profile_scraper = ProfilePageScraper(
+    stealth_controller=StealthController.from_config(STEALTH_PROFILE_NAME)
+)
+
+# In-process TTL/LRU cache of successful responses keyed by (session id,
+# username, mode), so a profile seen by one account is never served to another.
+# Lifetime in seconds comes from LINKEDIN_CACHE_TTL; 0 disables caching.
+DEFAULT_CACHE_TTL = 600
+CACHE_MAXSIZE = 512
+CacheKey = Tuple[str, str, str]
+_profile_cache: "OrderedDict[CacheKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _cache_ttl() -> int:
+    """Get the configured profile cache lifetime in seconds."""
+    return int(os.getenv("LINKEDIN_CACHE_TTL", str(DEFAULT_CACHE_TTL)))
+
+
+def _cache_get(key: CacheKey) -> Optional[Dict[str, Any]]:
+    """Return a fresh cached response for key, evicting it if expired.
+
+    Cache operations never await, so they are atomic on the event loop and
+    need no lock.
     """
-    Get a person's LinkedIn profile with basic information only (fast mode).
+    entry = _profile_cache.get(key)
+    if entry is None:
+        return None
 
-    This tool scrapes only essential profile data for quick lookups.
-    Performance target: <5 seconds with new stealth system, <2 seconds with NO_STEALTH profile.
+    expires_at, response = entry
+    if time.monotonic() >= expires_at:
+        del _profile_cache[key]
+        return None
 
-    Args:
-        linkedin_username (str): LinkedIn username (e.g., "stickerdaniel", "anistji")
+    _profile_cache.move_to_end(key)
+    return response
 
-    Returns:
-        Dict[str, Any]: Basic profile data including name, headline, location, about, and current company
+
+def _cache_put(key: CacheKey, response: Dict[str, Any]) -> None:
+    """Store a copy of a response without its _performance block, honoring the TTL.
+
+    The copy is deep, so callers mutating the returned response's nested
+    lists cannot change what later cache hits serve.
     """
-    start_time = time.time()
+    ttl = _cache_ttl()
+    if ttl <= 0:
+        return
+
+    cached = copy.deepcopy({k: v for k, v in response.items() if k != "_performance"})
+    _profile_cache[key] = (time.monotonic() + ttl, cached)
+    _profile_cache.move_to_end(key)
+    while len(_profile_cache) > CACHE_MAXSIZE:
+        _profile_cache.popitem(last=False)
+
+
+def clear_profile_cache() -> None:
+    """Drop every cached profile response."""
+    _profile_cache.clear()
+
+
+def _cache_hit_response(cached: Dict[str, Any], scraping_mode: str) -> Dict[str, Any]:
+    """Build a tool response from a deep copy of a cached profile."""
+    return {
+        **copy.deepcopy(cached),
+        "_performance": {
+            "duration_seconds": 0.0,
+            "cache": "hit",
+            "stealth_system": "NEW (centralized)",
+            "stealth_profile": STEALTH_PROFILE_NAME,
+            "scraping_mode": scraping_mode,
+        },
+    }
+
 
+def _max_concurrency() -> int:
+    """Get the configured cap on concurrently scraped profiles.
+
+    An unparsable LINKEDIN_MAX_CONCURRENCY falls back to the default instead
+    of failing the batch.
+    """
+    value = os.getenv("LINKEDIN_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))
     try:
-        import os
-        from patchright.async_api import async_playwright
-        from linkedin_mcp_server.scraper.config import PersonScrapingFields
-        from linkedin_mcp_server.scraper.pages.profile_page import ProfilePageScraper
+        return int(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid LINKEDIN_MAX_CONCURRENCY {value!r}, "
+            f"using {DEFAULT_MAX_CONCURRENCY}"
+        )
+        return DEFAULT_MAX_CONCURRENCY
 
-        # Construct LinkedIn URL
-        linkedin_url = f"https://www.linkedin.com/in/{linkedin_username}/"
 
-        # Set environment for optimal performance
-        os.environ["STEALTH_PROFILE"] = "NO_STEALTH"
-        os.environ["USE_NEW_STEALTH"] = "true"
+def _profile_url(linkedin_username: str) -> str:
+    """Build the profile URL scraped for a LinkedIn username."""
+    return f"https://www.linkedin.com/in/{linkedin_username}/"
 
-        # Start browser directly (like working test script)
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=True, channel="chrome")
-        context = await browser.new_context()
-        page = await context.new_page()
 
-        # Add LinkedIn cookie
-        cookie = os.getenv("LINKEDIN_COOKIE")
-        if cookie:
-            await context.add_cookies(
-                [
-                    {
-                        "name": "li_at",
-                        "value": cookie,
-                        "domain": ".linkedin.com",
-                        "path": "/",
-                    }
-                ]
-            )
-        else:
-            raise ValueError("LINKEDIN_COOKIE environment variable not set")
+def _is_transient_browser_error(error: BaseException) -> bool:
+    """Check whether a scrape failed on a Playwright error worth one retry.
 
-        # Create scraper and use centralized scrape_page method
-        scraper = ProfilePageScraper()
-        person = await scraper.scrape_page(
-            page, linkedin_url, fields=PersonScrapingFields.MINIMAL
+    The scraper wraps navigation failures (e.g. LinkedInDetectionError inside
+    the stealth failure), so the whole cause chain is searched.
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        if isinstance(current, PlaywrightError):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
+
+
+async def _check_auth_wall(cookie: str, page: Page) -> None:
+    """Evict the cookie's cached context and fail if LinkedIn showed a login wall."""
+    if is_auth_wall(page.url):
+        await evict_context(cookie)
+        raise InvalidCredentialsError(
+            "LinkedIn session was logged out or the cookie expired"
         )
 
-        # Clean up with error handling to prevent asyncio conflicts
-        try:
-            await browser.close()
-        except Exception as e:
-            logger.debug(f"Browser close error (non-critical): {e}")
 
-        try:
-            await playwright.stop()
-        except Exception as e:
-            logger.debug(f"Playwright stop error (non-critical): {e}")
+async def _scrape_profile(
+    linkedin_username: str,
+    fields: PersonScrapingFields,
+    scraping_mode: str,
+    tool_name: str,
+    on_section: Optional[SectionCallback] = None,
+    include: Optional[AbstractSet[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Scrape a profile on the shared context and build the tool response.
+
+    Args:
+        linkedin_username (str): LinkedIn username
+        fields (PersonScrapingFields): Sections to extract
+        scraping_mode (str): Mode reported in the _performance block and cache key
+        tool_name (str): Tool name used for error responses
+        on_section (SectionCallback, optional): Awaited after each extracted section
+        include (AbstractSet[str], optional): Person fields to return, default all
+
+    Returns:
+        Dict[str, Any]: Raw model output with performance metrics, or an error response
+    """
+    start_time = time.time()
 
-        # Small delay to allow background cleanup to complete
-        import asyncio
+    try:
+        # Fail fast before touching the cache or the browser
+        cookie = os.getenv("LINKEDIN_COOKIE")
+        if not cookie:
+            raise ValueError("LINKEDIN_COOKIE environment variable not set")
 
-        await asyncio.sleep(0.1)
+        cache_key = (
+            PlaywrightSessionManager._session_id_for_cookie(cookie),
+            linkedin_username,
+            scraping_mode,
+        )
+        if _cache_ttl() > 0 and (cached := _cache_get(cache_key)) is not None:
+            return _cache_hit_response(cached, scraping_mode)
+
+        linkedin_url = _profile_url(linkedin_username)
+
+        for attempt in range(1, SCRAPE_ATTEMPTS + 1):
+            page: Optional[Page] = None
+            parked = False
+            try:
+                # Look the context up on every attempt: a browser that
+                # disconnected is relaunched with fresh contexts
+                context = await get_context(cookie)
+                if attempt == 1:
+                    # Reuse the cached context's idle page when there is one
+                    page, uses = await checkout_page(context)
+                else:
+                    page, uses = await context.new_page(), 0
+
+                # Use the shared scraper's centralized scrape_page method
+                person = await _profile_scraper.scrape_page(
+                    page, linkedin_url, fields=fields, on_section=on_section
+                )
+                await _check_auth_wall(cookie, page)
+                # Healthy pages go back to the pool; failed ones are closed
+                parked = park_page(context, page, uses + 1)
+                break
+            except Exception as e:
+                if page is not None and not isinstance(e, InvalidCredentialsError):
+                    await _check_auth_wall(cookie, page)
+                if attempt == SCRAPE_ATTEMPTS or not _is_transient_browser_error(e):
+                    raise
+                logger.warning(
+                    f"Transient browser error scraping {linkedin_username}, "
+                    f"retrying on a fresh page: {e}"
+                )
+            finally:
+                # Clean up with error handling to prevent asyncio conflicts;
+                # a hung close must not hold up the response
+                if page is not None and not parked:
+                    try:
+                        async with asyncio.timeout(PAGE_CLOSE_TIMEOUT):
+                            await page.close()
+                    except Exception as e:
+                        logger.debug(f"Page close error (non-critical): {e}")
 
         # Calculate timing
         duration = time.time() - start_time
 
-        # Return raw model output with performance metrics
-        result = person.model_dump()
+        # Return raw model output with performance metrics. JSON mode lets
+        # pydantic-core emit plain str/int values (e.g. HttpUrl) in one pass
+        result = person.model_dump(mode="json", include=include)
         result["_performance"] = {
             "duration_seconds": round(duration, 1),
             "stealth_system": "NEW (centralized)",
-            "stealth_profile": "NO_STEALTH",
-            "scraping_mode": "minimal",
+            "stealth_profile": STEALTH_PROFILE_NAME,
+            "scraping_mode": scraping_mode,
         }
+        _cache_put(cache_key, result)
         return result
 
     except Exception as e:
-        return handle_tool_error(e, "get_person_profile_minimal")
+        return handle_tool_error(e, tool_name)
 
 
-async def get_person_profile(linkedin_username: str) -> Dict[str, Any]:
+async def get_person_profile_minimal(linkedin_username: str) -> Dict[str, Any]:
+    """
+    Get a person's LinkedIn profile with basic information only (fast mode).
+
+    This tool scrapes only essential profile data for quick lookups.
+    Performance target: <5 seconds with new stealth system, <2 seconds with NO_STEALTH profile.
+
+    Args:
+        linkedin_username (str): LinkedIn username (e.g., "stickerdaniel", "anistji")
+
+    Returns:
+        Dict[str, Any]: Basic profile data including name, headline, location, about, and current company
+    """
+    return await _scrape_profile(
+        linkedin_username,
+        PersonScrapingFields.MINIMAL,
+        "minimal",
+        "get_person_profile_minimal",
+        include=MINIMAL_RESPONSE_FIELDS,
+    )
+
+
+async def get_person_profile(
+    linkedin_username: str, ctx: Optional[Context] = None
+) -> Dict[str, Any]:
     """
     Get a comprehensive person's LinkedIn profile with all available data.
 
@@ -122,86 +330,66 @@ async def get_person_profile(linkedin_username: str) -> Dict[str, Any]:
     - Legacy system: ~300 seconds (5 minutes)
     - New stealth system: ~75 seconds with MINIMAL_STEALTH, ~50 seconds with NO_STEALTH
 
+    MCP tool results are delivered as a single message, so progress is reported
+    per extracted section through the request context instead of streaming.
+
     Args:
         linkedin_username (str): LinkedIn username (e.g., "stickerdaniel", "anistji")
+        ctx (Context, optional): MCP request context used for progress notifications
 
     Returns:
         Dict[str, Any]: Complete structured profile data matching testdata/testscrape.txt format
     """
-    start_time = time.time()
-
-    try:
-        import os
-        from patchright.async_api import async_playwright
-        from linkedin_mcp_server.scraper.config import PersonScrapingFields
-        from linkedin_mcp_server.scraper.pages.profile_page import ProfilePageScraper
-
-        # Construct LinkedIn URL
-        linkedin_url = f"https://www.linkedin.com/in/{linkedin_username}/"
-
-        # Set environment for optimal performance (match .env settings)
-        os.environ["STEALTH_PROFILE"] = "NO_STEALTH"
-        os.environ["USE_NEW_STEALTH"] = "true"
 
-        # Start browser directly (like working test script)
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=True, channel="chrome")
-        context = await browser.new_context()
-        page = await context.new_page()
+    async def report_section(section: str, completed: int, total: int) -> None:
+        if ctx is not None:
+            await ctx.report_progress(completed, total)
 
-        # Add LinkedIn cookie
-        cookie = os.getenv("LINKEDIN_COOKIE")
-        if cookie:
-            await context.add_cookies(
-                [
-                    {
-                        "name": "li_at",
-                        "value": cookie,
-                        "domain": ".linkedin.com",
-                        "path": "/",
-                    }
-                ]
-            )
-        else:
-            raise ValueError("LINKEDIN_COOKIE environment variable not set")
-
-        # Create scraper and use centralized scrape_page method
-        scraper = ProfilePageScraper()
-        person = await scraper.scrape_page(
-            page, linkedin_url, fields=PersonScrapingFields.ALL
-        )
-
-        # Clean up with error handling to prevent asyncio conflicts
-        try:
-            await browser.close()
-        except Exception as e:
-            logger.debug(f"Browser close error (non-critical): {e}")
+    return await _scrape_profile(
+        linkedin_username,
+        PersonScrapingFields.ALL,
+        "comprehensive",
+        "get_person_profile",
+        on_section=report_section,
+    )
 
-        try:
-            await playwright.stop()
-        except Exception as e:
-            logger.debug(f"Playwright stop error (non-critical): {e}")
 
-        # Small delay to allow background cleanup to complete
-        import asyncio
-
-        await asyncio.sleep(0.1)
+async def get_person_profiles(
+    linkedin_usernames: List[str], comprehensive: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Get several people's LinkedIn profiles concurrently.
 
-        # Calculate timing
-        duration = time.time() - start_time
+    Profiles are scraped in parallel pages of the shared authenticated context,
+    bounded by LINKEDIN_MAX_CONCURRENCY (default 4) to stay within LinkedIn's
+    rate limits. Results keep the order of the requested usernames; a failed
+    profile yields an error entry instead of failing the batch.
 
-        # Return raw model output with performance metrics
-        result = person.model_dump()
-        result["_performance"] = {
-            "duration_seconds": round(duration, 1),
-            "stealth_system": "NEW (centralized)",
-            "stealth_profile": "NO_STEALTH",
-            "scraping_mode": "comprehensive",
-        }
-        return result
+    Args:
+        linkedin_usernames (List[str]): LinkedIn usernames (e.g., ["stickerdaniel", "anistji"])
+        comprehensive (bool): Scrape full profiles instead of basic info only (slower)
 
-    except Exception as e:
-        return handle_tool_error(e, "get_person_profile")
+    Returns:
+        List[Dict[str, Any]]: One profile or error response per requested username
+    """
+    max_concurrency = _max_concurrency()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    scrape = get_person_profile if comprehensive else get_person_profile_minimal
+
+    async def scrape_bounded(linkedin_username: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await scrape(linkedin_username)
+
+    results = await asyncio.gather(
+        *(scrape_bounded(username) for username in linkedin_usernames),
+        return_exceptions=True,
+    )
+    return [
+        handle_tool_error(result, "get_person_profiles")
+        if isinstance(result, Exception)
+        else result
+        for result in results
+    ]
 
 
 def register_person_tools(mcp: FastMCP) -> None:
@@ -214,3 +402,4 @@ def register_person_tools(mcp: FastMCP) -> None:
     # Register the standalone functions as MCP tools
     mcp.tool()(get_person_profile_minimal)
     mcp.tool()(get_person_profile)
+    mcp.tool()(get_person_profiles)
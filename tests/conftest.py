@@ -0,0 +1,100 @@
+# tests/conftest.py
+"""
+Shared pytest fixtures.
+
+The expected profile from testdata/testscrape.txt is parsed once per session;
+tests receive a deep copy so they can mutate it freely. The person tool tests
+share a stubbed cookie, context and scraper to drive the tools without a browser.
+"""
+
+import copy
+import functools
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from linkedin_mcp_server.tools import person as person_tools
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is a dev dependency; stdlib json parses the same data
+    import json as _json
+
+TESTDATA_PATH = Path(__file__).parents[1] / "testdata" / "testscrape.txt"
+TESTDATA_MISSING = (
+    "testdata/testscrape.txt not found - required for compatibility testing"
+)
+JSON_NOT_FOUND = "Could not find JSON data in {path}"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_testdata(path: str, mtime_ns: int) -> dict:
+    """Parse the JSON response section of a testdata file.
+
+    Keyed on the modification time so an edited file is parsed again.
+    """
+    content = Path(path).read_bytes()
+    # Extract JSON from the response section
+    json_start = content.find(b'{\n  "name"')
+    if json_start == -1:
+        pytest.fail(JSON_NOT_FOUND.format(path=path))  # type: ignore[misc]
+
+    return _json.loads(content[json_start:])
+
+
+@pytest.fixture(scope="session")
+def _expected_profile_raw():
+    """Parsed expected profile data from testdata/testscrape.txt"""
+    if not TESTDATA_PATH.exists():
+        pytest.skip(TESTDATA_MISSING)  # type: ignore[misc]
+
+    return _load_testdata(str(TESTDATA_PATH), TESTDATA_PATH.stat().st_mtime_ns)
+
+
+@pytest.fixture
+def expected_profile_data(_expected_profile_raw):
+    """Expected profile data, copied so tests cannot leak mutations"""
+    return copy.deepcopy(_expected_profile_raw)
+
+
+@pytest.fixture
+def clear_profile_cache():
+    """Start a test with an empty profile cache and leave none behind"""
+    person_tools._profile_cache.clear()
+    yield
+    person_tools._profile_cache.clear()
+
+
+@pytest.fixture
+def mock_context():
+    """Mock cached authenticated context handing out a mock profile page"""
+    context = AsyncMock()
+    page = AsyncMock()
+    page.url = person_tools._profile_url("testuser")
+    page.close = AsyncMock()
+    context.new_page = AsyncMock(return_value=page)
+    return context
+
+
+@pytest.fixture
+def scrape_stack(clear_profile_cache, mock_context):
+    """Cookie, cached context and shared scraper wired for a person tool scrape.
+
+    Tests configure stack.scraper.scrape_page before calling the tool.
+    """
+    get_context = AsyncMock(return_value=mock_context)
+    # Stub scraper exposing only scrape_page; any other use fails loudly
+    mock_scraper = Mock(spec=["scrape_page"], scrape_page=AsyncMock())
+    with (
+        patch.dict("os.environ", {"LINKEDIN_COOKIE": "test_cookie_value"}),
+        patch.object(person_tools, "get_context", get_context),
+        patch.object(person_tools, "_profile_scraper", mock_scraper),
+    ):
+        yield SimpleNamespace(
+            get_context=get_context,
+            context=mock_context,
+            page=mock_context.new_page.return_value,
+            scraper=mock_scraper,
+        )
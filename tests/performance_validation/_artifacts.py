@@ -0,0 +1,25 @@
+"""Opt-in output for the performance validation scripts."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is a dev dependency; stdlib json writes the same data
+    orjson = None
+
+# Set LINKEDIN_TEST_VERBOSE=1 to save every extracted profile and print full reports
+VERBOSE = os.getenv("LINKEDIN_TEST_VERBOSE") == "1"
+
+
+def save_profile(data: Any, filename: str, directory: Optional[Path] = None) -> Path:
+    """Write extracted profile data as indented JSON and return its path."""
+    path = (directory or Path.cwd()) / filename
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+    else:
+        content = json.dumps(data, indent=2, default=str).encode()
+    path.write_bytes(content)
+    return path
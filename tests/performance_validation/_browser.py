@@ -0,0 +1,66 @@
+"""Shared Playwright setup for the performance validation scripts."""
+
+import asyncio
+import functools
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+from patchright.async_api import BrowserContext, async_playwright
+
+from linkedin_mcp_server.config.providers import get_cookie_from_keyring
+
+# Chromium profile reused across validation runs so caches stay warm
+USER_DATA_DIR = Path(__file__).parent / ".pw-profile"
+
+
+@functools.lru_cache(maxsize=1)
+def resolve_linkedin_cookie() -> Optional[str]:
+    """Resolve the li_at cookie once per process.
+
+    Reads the same sources as get_authentication() without going through
+    get_config(), which parses sys.argv and rejects pytest's arguments.
+    """
+    return os.getenv("LINKEDIN_COOKIE") or get_cookie_from_keyring()
+
+
+@asynccontextmanager
+async def open_linkedin_context(
+    cookie: Optional[str] = None, **launch_options: Any
+) -> AsyncIterator[BrowserContext]:
+    """Launch bundled Chromium on the persistent profile and yield its context.
+
+    The profile keeps LinkedIn's HTTP cache and compiled scripts between runs;
+    the li_at cookie is only written when the profile does not carry it yet.
+    Without an explicit cookie, it is resolved in a worker thread while
+    Chromium starts. Launch options override the headless default.
+    """
+    cookie_task = None
+    if cookie is None:
+        cookie_task = asyncio.create_task(asyncio.to_thread(resolve_linkedin_cookie))
+
+    async with async_playwright() as playwright:
+        context = await playwright.chromium.launch_persistent_context(
+            USER_DATA_DIR, **{"headless": True, **launch_options}
+        )
+        try:
+            if cookie_task is not None:
+                cookie = await cookie_task
+            if cookie and not any(
+                stored["name"] == "li_at" and stored["value"] == cookie
+                for stored in await context.cookies("https://www.linkedin.com")
+            ):
+                await context.add_cookies(
+                    [
+                        {
+                            "name": "li_at",
+                            "value": cookie,
+                            "domain": ".linkedin.com",
+                            "path": "/",
+                        }
+                    ]
+                )
+            yield context
+        finally:
+            await context.close()
@@ -0,0 +1,56 @@
+"""Shared drihs extraction driver for the performance validation tests."""
+
+from typing import Dict, Optional, Tuple
+
+from patchright.async_api import BrowserContext
+
+from linkedin_mcp_server.scraper.config import PersonScrapingFields
+from linkedin_mcp_server.scraper.models.person import Person
+from linkedin_mcp_server.scraper.pages.profile_page import ProfilePageScraper
+from linkedin_mcp_server.scraper.stealth.controller import StealthController
+from linkedin_mcp_server.scraper.stealth.profiles import get_stealth_profile
+
+try:
+    from ._timing import PhaseTimer
+except ImportError:  # run directly as a script
+    from _timing import PhaseTimer
+
+DRIHS_URL = "https://www.linkedin.com/in/drihs/"
+
+
+async def extract_drihs(
+    context: BrowserContext,
+    fields: PersonScrapingFields = PersonScrapingFields.ALL,
+    url: str = DRIHS_URL,
+    stealth_profile: Optional[str] = None,
+) -> Tuple[Person, Dict[str, float]]:
+    """Scrape a profile on a fresh page of ``context``.
+
+    Args:
+        context: Authenticated browser context to open the page on
+        fields: Sections to scrape
+        url: Profile URL, the drihs profile by default
+        stealth_profile: Stealth profile name; STEALTH_PROFILE when None
+
+    Returns:
+        The scraped Person and per-phase timings in seconds for page, scraper,
+        scrape, cleanup and total
+    """
+    timer = PhaseTimer()
+
+    with timer.phase("page"):
+        page = await context.new_page()
+    try:
+        with timer.phase("scraper"):
+            scraper = ProfilePageScraper(
+                StealthController(profile=get_stealth_profile(stealth_profile))
+            )
+        with timer.phase("scrape"):
+            person = await scraper.scrape_page(page, url, fields=fields)
+    finally:
+        with timer.phase("cleanup"):
+            await page.close()
+
+    timings = {name: timer[name] for name in timer.durations_ns}
+    timings["total"] = timer.elapsed
+    return person, timings
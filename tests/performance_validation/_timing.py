@@ -0,0 +1,31 @@
+"""Phase timing for the performance validation scripts."""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class PhaseTimer:
+    """Record how long named phases take using the monotonic ns clock."""
+
+    def __init__(self) -> None:
+        self._start_ns = time.perf_counter_ns()
+        self.durations_ns: Dict[str, int] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase ``name``."""
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.durations_ns[name] = time.perf_counter_ns() - start_ns
+
+    def __getitem__(self, name: str) -> float:
+        """Duration of a finished phase in seconds."""
+        return self.durations_ns[name] / 1e9
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the timer was created."""
+        return (time.perf_counter_ns() - self._start_ns) / 1e9
@@ -0,0 +1,27 @@
+"""
+Fixtures for the performance validation scripts.
+
+One browser and one authenticated context are shared by every test in the
+session; each test opens its own page on it.
+"""
+
+import pytest
+import pytest_asyncio
+
+from ._browser import open_linkedin_context, resolve_linkedin_cookie
+
+
+@pytest.fixture(scope="session")
+def linkedin_cookie():
+    """LinkedIn li_at cookie, resolved once; skips when none is configured"""
+    cookie = resolve_linkedin_cookie()
+    if not cookie:
+        pytest.skip("No LinkedIn cookie configured")
+    return cookie
+
+
+@pytest_asyncio.fixture(scope="session")
+async def linkedin_context(linkedin_cookie):
+    """Browser context authenticated with the configured LinkedIn cookie"""
+    async with open_linkedin_context(linkedin_cookie) as context:
+        yield context
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Repeated-round timing of drihs extraction to catch performance regressions."""
+
+import asyncio
+import os
+import statistics
+import sys
+
+import pytest
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+os.environ["STEALTH_PROFILE"] = "NO_STEALTH"
+os.environ["USE_NEW_STEALTH"] = "true"
+
+# Imported after the environment is set; kept out of the timed phases
+try:
+    from ._browser import open_linkedin_context
+    from ._drihs_runner import extract_drihs
+except ImportError:  # run directly as a script
+    from _browser import open_linkedin_context
+    from _drihs_runner import extract_drihs
+
+pytestmark = [pytest.mark.network, pytest.mark.slow]
+
+# Rounds per run and the mean scrape time, in seconds, that counts as a regression
+ROUNDS = 5
+MEAN_SCRAPE_BUDGET = 15.0
+
+
+async def test_extraction_bench(linkedin_context):
+    """Mean drihs scrape time over several rounds should stay within budget."""
+    scrape_times = []
+    for _ in range(ROUNDS):
+        person, timings = await extract_drihs(linkedin_context)
+        assert person.name
+        scrape_times.append(timings["scrape"])
+
+    mean = statistics.mean(scrape_times)
+    sys.stdout.write(
+        f"scrape_page() over {ROUNDS} rounds: "
+        f"mean {mean:.2f}s, median {statistics.median(scrape_times):.2f}s, "
+        f"stdev {statistics.stdev(scrape_times):.2f}s, "
+        f"min {min(scrape_times):.2f}s, max {max(scrape_times):.2f}s\n"
+    )
+
+    assert mean < MEAN_SCRAPE_BUDGET, f"Mean scrape time {mean:.2f}s over budget"
+
+
+async def _main():
+    async with open_linkedin_context() as context:
+        await test_extraction_bench(context)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,74 @@
+"""Unit tests for the stealth controller."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from linkedin_mcp_server.scraper.stealth import controller as controller_module
+from linkedin_mcp_server.scraper.stealth.controller import (
+    PageType,
+    StealthController,
+)
+from linkedin_mcp_server.scraper.stealth.profiles import StealthProfile
+
+
+class TestStealthController:
+    """Test stealth controller orchestration."""
+
+    async def test_telemetry_recorded_off_response_path(self):
+        """Scraping should return without waiting for telemetry to finish."""
+        controller = StealthController(profile=StealthProfile.NO_STEALTH())
+        release = asyncio.Event()
+
+        async def slow_record(*args):
+            await release.wait()
+
+        with (
+            patch.object(controller, "_navigate_to_page", AsyncMock()),
+            patch.object(
+                controller, "_ensure_content_loaded", AsyncMock(return_value=[])
+            ),
+            patch.object(controller, "_simulate_page_interaction", AsyncMock()),
+            patch.object(controller, "_record_telemetry", side_effect=slow_record),
+        ):
+            # Every phase touching the page is patched, so any object will do
+            result = await controller.scrape_linkedin_page(
+                object(),
+                "https://www.linkedin.com/in/testuser/",
+                PageType.PROFILE,
+                [],
+            )
+
+            assert result.success is True
+            assert len(controller_module._telemetry_tasks) == 1
+
+            release.set()
+            await asyncio.gather(*controller_module._telemetry_tasks)
+
+        assert not controller_module._telemetry_tasks
+
+    async def test_controllers_share_telemetry_instance(self):
+        """Every controller should record into the same telemetry instance."""
+        first = StealthController(profile=StealthProfile.NO_STEALTH())
+        second = StealthController(profile=StealthProfile.NO_STEALTH())
+
+        with patch(
+            "linkedin_mcp_server.scraper.stealth.telemetry._shared_telemetry",
+            AsyncMock(),
+        ):
+            await first._record_telemetry("https://example.com", 1.0, True)
+            await second._record_telemetry("https://example.com", 1.0, False)
+
+        assert first.telemetry is second.telemetry
+        first.telemetry.record_success.assert_awaited_once()
+        first.telemetry.record_failure.assert_awaited_once()
+
+    def test_from_config_profile_override_keeps_telemetry_setting(self):
+        """An explicit profile should still honor STEALTH_TELEMETRY."""
+        with patch.dict(
+            "os.environ",
+            {"STEALTH_PROFILE": "MAXIMUM_STEALTH", "STEALTH_TELEMETRY": "false"},
+        ):
+            controller = StealthController.from_config("NO_STEALTH")
+
+        assert controller.profile.name == "NO_STEALTH"
+        assert controller.telemetry_enabled is False
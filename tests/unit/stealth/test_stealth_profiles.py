@@ -1,5 +1,6 @@
 """Unit tests for stealth profiles and configuration."""
 
+import dataclasses
 import pytest
 import os
 from unittest.mock import patch
@@ -15,50 +16,70 @@ from linkedin_mcp_server.scraper.stealth.profiles import (
 class TestStealthProfiles:
     """Test stealth profile configurations."""
 
-    def test_no_stealth_profile_settings(self):
-        """NO_STEALTH profile should have minimal settings for maximum speed."""
+    @pytest.mark.parametrize(
+        "factory,expected,delays_ok",
+        [
+            # Minimal settings and delays for maximum speed, higher throughput
+            (
+                StealthProfile.NO_STEALTH,
+                {
+                    "name": "NO_STEALTH",
+                    "navigation": NavigationMode.DIRECT,
+                    "simulation": SimulationLevel.NONE,
+                    "enable_fingerprint_masking": False,
+                    "session_warming": False,
+                    "rate_limit_per_minute": 10,
+                },
+                lambda delays: delays.base[0] < 0.5 and delays.reading[0] < 1.0,
+            ),
+            # Balances speed and stealth with moderate delays
+            (
+                StealthProfile.MINIMAL_STEALTH,
+                {
+                    "name": "MINIMAL_STEALTH",
+                    "navigation": NavigationMode.DIRECT,
+                    "simulation": SimulationLevel.BASIC,
+                    "enable_fingerprint_masking": True,
+                    "session_warming": False,
+                    "rate_limit_per_minute": 3,
+                },
+                lambda delays: (
+                    0.5 <= delays.base[0] <= 1.0 and 0.5 <= delays.reading[0] <= 2.0
+                ),
+            ),
+            # Matches the current system's behavior and delays
+            (
+                StealthProfile.MAXIMUM_STEALTH,
+                {
+                    "name": "MAXIMUM_STEALTH",
+                    "navigation": NavigationMode.SEARCH_FIRST,
+                    "simulation": SimulationLevel.COMPREHENSIVE,
+                    "enable_fingerprint_masking": True,
+                    "session_warming": True,
+                    "rate_limit_per_minute": 1,
+                },
+                lambda delays: (
+                    delays.base == (1.5, 4.0) and delays.reading == (2.0, 6.0)
+                ),
+            ),
+        ],
+        ids=["no_stealth", "minimal_stealth", "maximum_stealth"],
+    )
+    def test_profile_settings(self, factory, expected, delays_ok):
+        """Each preset profile should carry its documented settings."""
+        profile = factory()
+
+        assert {field: getattr(profile, field) for field in expected} == expected
+        assert delays_ok(profile.delays), profile.delays
+
+    def test_profile_presets_are_shared_and_immutable(self):
+        """Preset factories should return one frozen instance per profile."""
         profile = StealthProfile.NO_STEALTH()
 
-        assert profile.name == "NO_STEALTH"
-        assert profile.navigation == NavigationMode.DIRECT
-        assert profile.simulation == SimulationLevel.NONE
-        assert profile.enable_fingerprint_masking is False
-        assert profile.session_warming is False
-        assert profile.rate_limit_per_minute == 10  # Higher throughput
-
-        # Delays should be minimal
-        assert profile.delays.base[0] < 0.5
-        assert profile.delays.reading[0] < 1.0
-
-    def test_minimal_stealth_profile_settings(self):
-        """MINIMAL_STEALTH should balance speed and stealth."""
-        profile = StealthProfile.MINIMAL_STEALTH()
-
-        assert profile.name == "MINIMAL_STEALTH"
-        assert profile.navigation == NavigationMode.DIRECT
-        assert profile.simulation == SimulationLevel.BASIC
-        assert profile.enable_fingerprint_masking is True
-        assert profile.session_warming is False
-        assert profile.rate_limit_per_minute == 3
-
-        # Delays should be moderate
-        assert 0.5 <= profile.delays.base[0] <= 1.0
-        assert 0.5 <= profile.delays.reading[0] <= 2.0
-
-    def test_maximum_stealth_profile_settings(self):
-        """MAXIMUM_STEALTH should match current system behavior."""
-        profile = StealthProfile.MAXIMUM_STEALTH()
-
-        assert profile.name == "MAXIMUM_STEALTH"
-        assert profile.navigation == NavigationMode.SEARCH_FIRST
-        assert profile.simulation == SimulationLevel.COMPREHENSIVE
-        assert profile.enable_fingerprint_masking is True
-        assert profile.session_warming is True
-        assert profile.rate_limit_per_minute == 1
-
-        # Delays should match current system
-        assert profile.delays.base == (1.5, 4.0)
-        assert profile.delays.reading == (2.0, 6.0)
+        assert StealthProfile.NO_STEALTH() is profile
+        assert get_stealth_profile("NO_STEALTH") is profile
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            profile.rate_limit_per_minute = 1  # type: ignore[misc]
 
     def test_profile_environment_variable_loading(self):
         """Profile should load from STEALTH_PROFILE environment variable."""
@@ -0,0 +1,247 @@
+# tests/unit/test_browser_pool.py
+"""
+Unit tests for the shared browser pool.
+
+Tests lazy launch, Chromium fallback, reuse across calls, relaunch after
+disconnect, cached authenticated contexts and their eviction, pooled pages,
+resource blocking, and shutdown including state left by another event loop.
+"""
+
+import asyncio
+import stat
+from pathlib import Path
+
+import pytest
+from patchright.async_api import Error as PlaywrightError
+from unittest.mock import AsyncMock, Mock, patch
+
+from linkedin_mcp_server.session import _loop_cleanup
+from linkedin_mcp_server.tools import _browser_pool
+
+
+class TestBrowserPool:
+    @pytest.fixture
+    def mock_playwright(self):
+        """Mock async_playwright() chain launching a connected browser"""
+        with patch(
+            "linkedin_mcp_server.tools._browser_pool.async_playwright"
+        ) as mock_factory:
+            playwright = AsyncMock()
+            browser = AsyncMock()
+            browser.is_connected = Mock(return_value=True)
+            browser.new_context = AsyncMock(side_effect=lambda **_: AsyncMock())
+            playwright.chromium.launch = AsyncMock(return_value=browser)
+            mock_factory.return_value.start = AsyncMock(return_value=playwright)
+            yield playwright
+
+    @pytest.fixture(autouse=True)
+    async def reset_pool(self):
+        """Close the shared browser after each test"""
+        yield
+        await _browser_pool.close_browser()
+
+    async def test_concurrent_calls_launch_once(self, mock_playwright):
+        """Test that concurrent callers share a single browser launch"""
+        browsers = await asyncio.gather(
+            *(_browser_pool.get_browser() for _ in range(10))
+        )
+
+        assert all(browser is browsers[0] for browser in browsers)
+        mock_playwright.chromium.launch.assert_awaited_once()
+
+    async def test_falls_back_to_bundled_chromium(self, mock_playwright):
+        """Test that a missing Chrome install falls back to bundled Chromium"""
+        browser = mock_playwright.chromium.launch.return_value
+        mock_playwright.chromium.launch.side_effect = [
+            PlaywrightError("Chromium distribution 'chrome' is not found"),
+            browser,
+        ]
+
+        assert await _browser_pool.get_browser() is browser
+
+        fallback = mock_playwright.chromium.launch.await_args_list[1]
+        assert "channel" not in fallback.kwargs
+
+    async def test_relaunch_after_disconnect(self, mock_playwright):
+        """Test that a disconnected browser is replaced on next use"""
+        browser = await _browser_pool.get_browser()
+        browser.is_connected.return_value = False
+
+        await _browser_pool.get_browser()
+
+        assert mock_playwright.chromium.launch.await_count == 2
+
+    async def test_context_cached_per_cookie(self, mock_playwright, tmp_path):
+        """Test that each cookie gets one long-lived context with the cookie set"""
+        with patch.object(
+            _browser_pool.PlaywrightSessionManager,
+            "_get_storage_state_path",
+            side_effect=lambda session_id: str(tmp_path / f"{session_id}.json"),
+        ):
+            first = await _browser_pool.get_context("cookie_a")
+            again = await _browser_pool.get_context("cookie_a")
+            other = await _browser_pool.get_context("cookie_b")
+
+        assert first is again
+        assert first is not other
+        first.add_cookies.assert_awaited_once()
+        assert first.add_cookies.call_args[0][0][0]["value"] == "cookie_a"
+
+    async def test_context_restores_storage_state(self, mock_playwright, tmp_path):
+        """Test that a persisted storage state is loaded instead of the cookie"""
+        state_file = tmp_path / "state.json"
+        state_file.write_text('{"cookies": [], "origins": []}')
+
+        with patch.object(
+            _browser_pool.PlaywrightSessionManager,
+            "_get_storage_state_path",
+            return_value=str(state_file),
+        ):
+            context = await _browser_pool.get_context("cookie_a")
+
+        browser = mock_playwright.chromium.launch.return_value
+        browser.new_context.assert_awaited_once_with(storage_state=str(state_file))
+        context.add_cookies.assert_not_awaited()
+
+    @pytest.fixture
+    async def cached_context(self, mock_playwright, tmp_path):
+        """Context cached for a cookie, handing out one open mock page"""
+        with patch.object(
+            _browser_pool.PlaywrightSessionManager,
+            "_get_storage_state_path",
+            side_effect=lambda session_id: str(tmp_path / f"{session_id}.json"),
+        ):
+            context = await _browser_pool.get_context("cookie_a")
+        page = Mock(is_closed=Mock(return_value=False))
+        context.new_page = AsyncMock(return_value=page)
+        return context
+
+    async def test_parked_page_reused_by_next_checkout(self, cached_context):
+        """Test that a page parked after a scrape is handed out again"""
+        page, uses = await _browser_pool.checkout_page(cached_context)
+        assert uses == 0
+
+        assert _browser_pool.park_page(cached_context, page, uses + 1)
+        again, uses = await _browser_pool.checkout_page(cached_context)
+
+        assert again is page
+        assert uses == 1
+        cached_context.new_page.assert_awaited_once()
+
+    async def test_park_page_refusals(self, cached_context):
+        """Test that worn-out pages, full pools and unknown contexts are refused"""
+        page = Mock(is_closed=Mock(return_value=False))
+        max_uses = _browser_pool.PAGE_MAX_USES
+
+        assert not _browser_pool.park_page(cached_context, page, max_uses)
+        assert not _browser_pool.park_page(AsyncMock(), page, 1)
+        for _ in range(_browser_pool.PAGE_POOL_SIZE):
+            assert _browser_pool.park_page(cached_context, page, 1)
+        assert not _browser_pool.park_page(cached_context, page, 1)
+
+    async def test_closed_idle_page_skipped(self, cached_context):
+        """Test that an idle page closed since parking is not handed out"""
+        stale = Mock(is_closed=Mock(return_value=False))
+        _browser_pool.park_page(cached_context, stale, 1)
+        stale.is_closed.return_value = True
+
+        page, uses = await _browser_pool.checkout_page(cached_context)
+
+        assert page is not stale
+        assert uses == 0
+
+    async def test_evict_context_drops_context_and_state(
+        self, mock_playwright, tmp_path
+    ):
+        """Test that an evicted context is closed and rebuilt from the cookie"""
+        state_file = tmp_path / "state.json"
+
+        with patch.object(
+            _browser_pool.PlaywrightSessionManager,
+            "_get_storage_state_path",
+            return_value=str(state_file),
+        ):
+            context = await _browser_pool.get_context("cookie_a")
+            state_file.write_text('{"cookies": [], "origins": []}')
+
+            await _browser_pool.evict_context("cookie_a")
+            fresh = await _browser_pool.get_context("cookie_a")
+
+        context.close.assert_awaited_once()
+        assert fresh is not context
+        fresh.add_cookies.assert_awaited_once()
+
+    async def test_saved_storage_state_private(self, tmp_path):
+        """Test that saved state, which holds the li_at cookie, is user-only"""
+        state_file = tmp_path / "state.json"
+        context = AsyncMock()
+        context.storage_state.side_effect = lambda path: Path(path).write_text("{}")
+
+        with patch.object(
+            _browser_pool.PlaywrightSessionManager,
+            "_get_storage_state_path",
+            return_value=str(state_file),
+        ):
+            await _browser_pool._save_storage_state("session", context)
+
+        assert stat.S_IMODE(state_file.stat().st_mode) == 0o600
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://www.linkedin.com/authwall?trk=public_profile", True),
+            ("https://www.linkedin.com/login?session_redirect=x", True),
+            ("https://www.linkedin.com/uas/login", True),
+            ("https://www.linkedin.com/in/testuser/", False),
+            ("https://example.com/login", False),
+        ],
+    )
+    def test_is_auth_wall(self, url, expected):
+        """Test that only LinkedIn login and auth wall URLs are flagged"""
+        assert _browser_pool.is_auth_wall(url) is expected
+
+    async def test_state_from_previous_loop_closed_on_that_loop(self):
+        """Test that switching loops shuts the old browser down on its loop"""
+        old_loop = asyncio.new_event_loop()
+        browser, playwright = AsyncMock(), AsyncMock()
+        with (
+            patch.object(_browser_pool, "_loop", old_loop),
+            patch.object(_browser_pool, "_lock", asyncio.Lock()),
+            patch.object(_browser_pool, "_browser", browser),
+            patch.object(_browser_pool, "_playwright", playwright),
+        ):
+            _browser_pool._get_lock()
+            await asyncio.gather(*_loop_cleanup._cleanup_tasks)
+        old_loop.close()
+
+        browser.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        "resource_type,url,blocked",
+        [
+            ("image", "https://media.licdn.com/photo.jpg", True),
+            ("font", "https://static.licdn.com/font.woff2", True),
+            ("script", "https://www.google-analytics.com/analytics.js", True),
+            ("document", "https://www.linkedin.com/in/testuser/", False),
+            ("stylesheet", "https://static.licdn.com/style.css", False),
+        ],
+    )
+    async def test_block_heavy_resources(self, resource_type, url, blocked):
+        """Test that media and trackers are aborted while page content loads"""
+        route = AsyncMock()
+        route.request = Mock(resource_type=resource_type, url=url)
+
+        await _browser_pool._block_heavy_resources(route)
+
+        assert route.abort.await_count == int(blocked)
+        assert route.continue_.await_count == int(not blocked)
+
+    async def test_close_browser_stops_playwright(self, mock_playwright):
+        """Test that shutdown closes the browser and stops Playwright"""
+        browser = await _browser_pool.get_browser()
+
+        await _browser_pool.close_browser()
+
+        browser.close.assert_awaited_once()
+        mock_playwright.stop.assert_awaited_once()
@@ -5,296 +5,452 @@ Unit tests for person profile tools.
 Tests tool logic, data transformation, and error handling.
 """
 
+import asyncio
+import copy
+from types import MappingProxyType
+
 import pytest
+from patchright.async_api import Error as PlaywrightError
+from patchright.async_api import TimeoutError as PlaywrightTimeoutError
 from unittest.mock import AsyncMock, Mock, patch
 
+from linkedin_mcp_server.scraper.pages.profile_page import ProfilePageScraper
+from linkedin_mcp_server.scraper.stealth.controller import StealthController
+from linkedin_mcp_server.scraper.stealth.profiles import StealthProfile
+from linkedin_mcp_server.tools import _browser_pool
+from linkedin_mcp_server.tools import person as person_tools
 from linkedin_mcp_server.tools.person import (
+    _profile_url,
     get_person_profile,
     get_person_profile_minimal,
+    get_person_profiles,
+)
+
+
+# URL the tools scrape for the "testuser" username
+PROFILE_URL = _profile_url("testuser")
+
+# Model dumps returned by the fake Person objects, read-only so a test cannot
+# leak changes into the next one
+MINIMAL_PROFILE_DUMP = MappingProxyType(
+    {
+        "name": "Test User",
+        "headline": "Software Developer",
+        "location": "San Francisco, CA",
+        "about": ["Passionate developer"],
+        "company": "Tech Corp",
+        "linkedin_url": "https://www.linkedin.com/in/testuser/",
+        "connection_count": 500,
+        "followers_count": 1200,
+        "website_url": "https://testuser.dev",
+        "open_to_work": False,
+        "experiences": [],
+        "educations": [],
+        "interests": [],
+        "languages": [],
+        "honors": [],
+        "connections": [],
+    }
 )
 
+FULL_PROFILE_DUMP = MappingProxyType(
+    {
+        "name": "Test User",
+        "headline": "Senior Software Developer",
+        "about": ["Full stack developer with 5 years experience"],
+        "company": "Tech Corp",
+        "linkedin_url": "https://www.linkedin.com/in/testuser/",
+        "connection_count": 500,
+        "followers_count": 1200,
+        "website_url": "https://testuser.dev",
+        "experiences": [
+            {
+                "position_title": "Senior Software Developer",
+                "institution_name": "Tech Corp Inc",
+                "from_date": "Jan 2020",
+                "to_date": "Present",
+                "duration": "4 yrs",
+                "location": "San Francisco, CA",
+                "description": "Full stack development using React and Node.js",
+            }
+        ],
+        "educations": [
+            {
+                "institution_name": "University of Technology",
+                "field_of_study": "Computer Science",
+                "degree": "Bachelor's",
+                "from_date": "2015",
+                "to_date": "2019",
+            }
+        ],
+        "interests": ["Programming", "Machine Learning", "Open Source"],
+        "languages": ["English", "Spanish"],
+        "honors": [],
+        "connections": [],
+        "open_to_work": False,
+    }
+)
+
+
+class _FakePerson:
+    """Stand-in for Person exposing only model_dump, recording each call"""
+
+    def __init__(self, data):
+        self._data = data
+        self.dump_calls = []
 
+    def model_dump(self, **kwargs):
+        self.dump_calls.append(kwargs)
+        # Fresh objects like a real dump, so tests mutating a response cannot
+        # reach the shared constants
+        return copy.deepcopy(dict(self._data))
+
+
+def _navigable_page(goto):
+    """Mock page that passes the navigator's challenge and ready checks"""
+    return Mock(
+        url="about:blank",
+        goto=goto,
+        locator=Mock(return_value=Mock(count=AsyncMock(return_value=0))),
+        wait_for_selector=AsyncMock(),
+        close=AsyncMock(),
+    )
+
+
+@pytest.mark.usefixtures("clear_profile_cache")
 class TestPersonTools:
     @pytest.fixture
     def mock_person_minimal(self):
-        """Mock Person object for minimal scraping"""
-        person = Mock()
-        person.model_dump.return_value = {
-            "name": "Test User",
-            "headline": "Software Developer",
-            "location": "San Francisco, CA",
-            "about": ["Passionate developer"],
-            "company": "Tech Corp",
-            "linkedin_url": "https://www.linkedin.com/in/testuser/",
-            "connection_count": 500,
-            "followers_count": 1200,
-            "website_url": "https://testuser.dev",
-            "open_to_work": False,
-            "experiences": [],
-            "educations": [],
-            "interests": [],
-            "languages": [],
-            "honors": [],
-            "connections": [],
-        }
-        return person
+        """Fake Person object for minimal scraping"""
+        return _FakePerson(MINIMAL_PROFILE_DUMP)
 
     @pytest.fixture
     def mock_person_full(self):
-        """Mock Person object for comprehensive scraping"""
-        person = Mock()
-        person.model_dump.return_value = {
-            "name": "Test User",
-            "headline": "Senior Software Developer",
-            "about": ["Full stack developer with 5 years experience"],
-            "company": "Tech Corp",
-            "linkedin_url": "https://www.linkedin.com/in/testuser/",
-            "connection_count": 500,
-            "followers_count": 1200,
-            "website_url": "https://testuser.dev",
-            "experiences": [
-                {
-                    "position_title": "Senior Software Developer",
-                    "institution_name": "Tech Corp Inc",
-                    "from_date": "Jan 2020",
-                    "to_date": "Present",
-                    "duration": "4 yrs",
-                    "location": "San Francisco, CA",
-                    "description": "Full stack development using React and Node.js",
-                }
-            ],
-            "educations": [
-                {
-                    "institution_name": "University of Technology",
-                    "field_of_study": "Computer Science",
-                    "degree": "Bachelor's",
-                    "from_date": "2015",
-                    "to_date": "2019",
-                }
-            ],
-            "interests": ["Programming", "Machine Learning", "Open Source"],
-            "languages": ["English", "Spanish"],
-            "honors": [],
-            "connections": [],
-            "open_to_work": False,
-        }
-        return person
-
-    @pytest.mark.asyncio
-    async def test_minimal_profile_success(self, mock_person_minimal):
-        """Test successful minimal profile scraping with new direct Playwright approach"""
-        with patch.dict("os.environ", {"LINKEDIN_COOKIE": "test_cookie_value"}):
-            with patch("patchright.async_api.async_playwright") as mock_playwright:
-                # Mock Playwright components properly
-                mock_playwright_instance = AsyncMock()
-                mock_browser = AsyncMock()
-                mock_context = AsyncMock()
-                mock_page = AsyncMock()
-
-                # Set up the async playwright chain properly
-                mock_playwright.return_value = mock_playwright_instance
-                mock_playwright_instance.start = AsyncMock(
-                    return_value=mock_playwright_instance
-                )
-                mock_playwright_instance.chromium.launch = AsyncMock(
-                    return_value=mock_browser
-                )
-                mock_browser.new_context = AsyncMock(return_value=mock_context)
-                mock_context.new_page = AsyncMock(return_value=mock_page)
-                mock_context.add_cookies = AsyncMock()
-                mock_browser.close = AsyncMock()
-                mock_playwright_instance.stop = AsyncMock()
-
-                # Mock ProfilePageScraper
-                with patch(
-                    "linkedin_mcp_server.scraper.pages.profile_page.ProfilePageScraper"
-                ) as mock_scraper_class:
-                    mock_scraper = AsyncMock()
-                    mock_scraper_class.return_value = mock_scraper
-                    mock_scraper.scrape_page = AsyncMock(
-                        return_value=mock_person_minimal
-                    )
-
-                    result = await get_person_profile_minimal("testuser")
-
-                    # Verify ProfilePageScraper was called correctly
-                    mock_scraper_class.assert_called_once()
-                    mock_scraper.scrape_page.assert_called_once()
-
-                    # Verify result contains raw model data plus performance metrics
-                    assert result["name"] == "Test User"
-                    assert result["headline"] == "Software Developer"
-                    assert (
-                        result["linkedin_url"]
-                        == "https://www.linkedin.com/in/testuser/"
-                    )
-                    assert result["connection_count"] == 500
-                    assert result["followers_count"] == 1200
-                    assert result["website_url"] == "https://testuser.dev"
-                    assert "_performance" in result
-                    assert result["_performance"]["scraping_mode"] == "minimal"
-                    assert result["_performance"]["stealth_profile"] == "NO_STEALTH"
-
-    @pytest.mark.asyncio
-    async def test_full_profile_success(self, mock_person_full):
-        """Test successful comprehensive profile scraping with new direct Playwright approach"""
-        with patch.dict("os.environ", {"LINKEDIN_COOKIE": "test_cookie_value"}):
-            with patch("patchright.async_api.async_playwright") as mock_playwright:
-                # Mock Playwright components properly
-                mock_playwright_instance = AsyncMock()
-                mock_browser = AsyncMock()
-                mock_context = AsyncMock()
-                mock_page = AsyncMock()
-
-                # Set up the async playwright chain properly
-                mock_playwright.return_value = mock_playwright_instance
-                mock_playwright_instance.start = AsyncMock(
-                    return_value=mock_playwright_instance
-                )
-                mock_playwright_instance.chromium.launch = AsyncMock(
-                    return_value=mock_browser
-                )
-                mock_browser.new_context = AsyncMock(return_value=mock_context)
-                mock_context.new_page = AsyncMock(return_value=mock_page)
-                mock_context.add_cookies = AsyncMock()
-                mock_browser.close = AsyncMock()
-                mock_playwright_instance.stop = AsyncMock()
-
-                # Mock ProfilePageScraper
-                with patch(
-                    "linkedin_mcp_server.scraper.pages.profile_page.ProfilePageScraper"
-                ) as mock_scraper_class:
-                    mock_scraper = AsyncMock()
-                    mock_scraper_class.return_value = mock_scraper
-                    mock_scraper.scrape_page = AsyncMock(return_value=mock_person_full)
-
-                    result = await get_person_profile("testuser")
-
-                    # Verify ProfilePageScraper was called correctly
-                    mock_scraper_class.assert_called_once()
-                    mock_scraper.scrape_page.assert_called_once()
-
-                    # Verify comprehensive result structure
-                    assert result["name"] == "Test User"
-                    assert result["headline"] == "Senior Software Developer"
-                    assert (
-                        result["linkedin_url"]
-                        == "https://www.linkedin.com/in/testuser/"
-                    )
-                    assert len(result["experiences"]) == 1
-                    assert len(result["educations"]) == 1
-                    assert len(result["interests"]) == 3
-                    assert result["interests"] == [
-                        "Programming",
-                        "Machine Learning",
-                        "Open Source",
-                    ]
-                    assert "_performance" in result
-                    assert result["_performance"]["scraping_mode"] == "comprehensive"
-
-    @pytest.mark.asyncio
-    async def test_minimal_profile_error_handling(self):
+        """Fake Person object for comprehensive scraping"""
+        return _FakePerson(FULL_PROFILE_DUMP)
+
+    async def test_minimal_profile_success(self, mock_person_minimal, scrape_stack):
+        """Test successful minimal profile scraping on the cached context"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_minimal
+
+        result = await get_person_profile_minimal("testuser")
+
+        # Verify the shared scraper was called once on the profile URL
+        scrape_stack.scraper.scrape_page.assert_called_once()
+        assert scrape_stack.scraper.scrape_page.call_args.args[1] == PROFILE_URL
+        assert mock_person_minimal.dump_calls == [
+            {"mode": "json", "include": person_tools.MINIMAL_RESPONSE_FIELDS}
+        ]
+
+        # Verify result is the raw model data plus performance metrics
+        performance = result.pop("_performance")
+        assert result == dict(MINIMAL_PROFILE_DUMP)
+        assert performance["scraping_mode"] == "minimal"
+        assert performance["stealth_profile"] == "NO_STEALTH"
+
+    async def test_full_profile_success(self, mock_person_full, scrape_stack):
+        """Test successful comprehensive profile scraping on the cached context"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_full
+
+        result = await get_person_profile("testuser")
+
+        # Verify the shared scraper was called once on the profile URL
+        scrape_stack.scraper.scrape_page.assert_called_once()
+        assert scrape_stack.scraper.scrape_page.call_args.args[1] == PROFILE_URL
+
+        # Verify comprehensive result is the raw model data plus performance metrics
+        performance = result.pop("_performance")
+        assert result == dict(FULL_PROFILE_DUMP)
+        assert performance["scraping_mode"] == "comprehensive"
+
+    @pytest.mark.parametrize(
+        "tool",
+        [get_person_profile_minimal, get_person_profile],
+        ids=["minimal", "full"],
+    )
+    async def test_profile_error_handling(self, tool):
         """Test error handling when LINKEDIN_COOKIE is not set"""
         with patch.dict("os.environ", {}, clear=True):  # Clear environment variables
-            result = await get_person_profile_minimal("testuser")
+            result = await tool("testuser")
 
             # Should return error structure from handle_tool_error
             assert result["error"] == "unknown_error"
             assert "LINKEDIN_COOKIE environment variable not set" in result["message"]
 
-    @pytest.mark.asyncio
-    async def test_full_profile_error_handling(self):
-        """Test error handling when LINKEDIN_COOKIE is not set"""
-        with patch.dict("os.environ", {}, clear=True):  # Clear environment variables
-            result = await get_person_profile("testuser")
+    async def test_username_to_url_conversion(self, mock_person_minimal, scrape_stack):
+        """Test that username is correctly converted to LinkedIn URL"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_minimal
 
-            # Should return error structure from handle_tool_error
-            assert result["error"] == "unknown_error"
-            assert "LINKEDIN_COOKIE environment variable not set" in result["message"]
+        await get_person_profile_minimal("john-doe")
 
-    @pytest.mark.asyncio
-    async def test_username_to_url_conversion(self, mock_person_minimal):
-        """Test that username is correctly converted to LinkedIn URL"""
-        with patch.dict("os.environ", {"LINKEDIN_COOKIE": "test_cookie_value"}):
-            with patch("patchright.async_api.async_playwright") as mock_playwright:
-                # Mock Playwright components properly
-                mock_playwright_instance = AsyncMock()
-                mock_browser = AsyncMock()
-                mock_context = AsyncMock()
-                mock_page = AsyncMock()
-
-                # Set up the async playwright chain properly
-                mock_playwright.return_value = mock_playwright_instance
-                mock_playwright_instance.start = AsyncMock(
-                    return_value=mock_playwright_instance
-                )
-                mock_playwright_instance.chromium.launch = AsyncMock(
-                    return_value=mock_browser
-                )
-                mock_browser.new_context = AsyncMock(return_value=mock_context)
-                mock_context.new_page = AsyncMock(return_value=mock_page)
-                mock_context.add_cookies = AsyncMock()
-                mock_browser.close = AsyncMock()
-                mock_playwright_instance.stop = AsyncMock()
-
-                with patch(
-                    "linkedin_mcp_server.scraper.pages.profile_page.ProfilePageScraper"
-                ) as mock_scraper_class:
-                    mock_scraper = AsyncMock()
-                    mock_scraper_class.return_value = mock_scraper
-                    mock_scraper.scrape_page = AsyncMock(
-                        return_value=mock_person_minimal
-                    )
-
-                    await get_person_profile_minimal("john-doe")
-
-                    # Verify the URL was constructed correctly
-                    call_args = mock_scraper.scrape_page.call_args
-                    url_arg = call_args[0][1]  # Second positional argument
-                    assert url_arg == "https://www.linkedin.com/in/john-doe/"
-
-    @pytest.mark.asyncio
-    async def test_browser_cleanup_handling(self, mock_person_minimal):
-        """Test that browser cleanup errors are handled gracefully"""
-        with patch.dict("os.environ", {"LINKEDIN_COOKIE": "test_cookie_value"}):
-            with patch("patchright.async_api.async_playwright") as mock_playwright:
-                # Mock Playwright components with cleanup errors
-                mock_playwright_instance = AsyncMock()
-                mock_browser = AsyncMock()
-                mock_context = AsyncMock()
-                mock_page = AsyncMock()
-
-                # Set up the async playwright chain properly
-                mock_playwright.return_value = mock_playwright_instance
-                mock_playwright_instance.start = AsyncMock(
-                    return_value=mock_playwright_instance
-                )
-                mock_playwright_instance.chromium.launch = AsyncMock(
-                    return_value=mock_browser
-                )
-                mock_browser.new_context = AsyncMock(return_value=mock_context)
-                mock_context.new_page = AsyncMock(return_value=mock_page)
-                mock_context.add_cookies = AsyncMock()
-
-                # Make browser.close() raise an exception
-                mock_browser.close = AsyncMock(
-                    side_effect=Exception("Browser close error")
-                )
-                mock_playwright_instance.stop = AsyncMock(
-                    side_effect=Exception("Playwright stop error")
-                )
-
-                with patch(
-                    "linkedin_mcp_server.scraper.pages.profile_page.ProfilePageScraper"
-                ) as mock_scraper_class:
-                    mock_scraper = AsyncMock()
-                    mock_scraper_class.return_value = mock_scraper
-                    mock_scraper.scrape_page = AsyncMock(
-                        return_value=mock_person_minimal
-                    )
-
-                    # Should complete successfully despite cleanup errors
-                    result = await get_person_profile_minimal("testuser")
-
-                    assert result["name"] == "Test User"
-                    assert "_performance" in result
+        # Verify the URL was constructed correctly (second positional argument)
+        url_arg = scrape_stack.scraper.scrape_page.call_args.args[1]
+        assert url_arg == _profile_url("john-doe")
+        assert url_arg == "https://www.linkedin.com/in/john-doe/"
+
+    async def test_browser_cleanup_handling(self, mock_person_minimal, scrape_stack):
+        """Test that page cleanup errors are handled gracefully"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_minimal
+        # Make page.close() raise an exception
+        scrape_stack.page.close.side_effect = Exception("Page close error")
+
+        # Should complete successfully despite cleanup errors
+        async with asyncio.timeout(5):
+            result = await get_person_profile_minimal("testuser")
+
+        assert result["name"] == "Test User"
+        assert "_performance" in result
+
+    async def test_successful_page_parked_instead_of_closed(
+        self, mock_person_minimal, scrape_stack
+    ):
+        """Test that a page is returned to the pool after a successful scrape"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_minimal
+
+        with patch.object(person_tools, "park_page", return_value=True) as park:
+            await get_person_profile_minimal("testuser")
+
+        park.assert_called_once_with(scrape_stack.context, scrape_stack.page, 1)
+        scrape_stack.page.close.assert_not_awaited()
+
+    async def test_hung_page_close_does_not_block_response(
+        self, mock_person_minimal, scrape_stack
+    ):
+        """Test that a page close that never finishes is abandoned after a timeout"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_minimal
+        scrape_stack.page.close.side_effect = asyncio.Event().wait
+
+        with patch.object(person_tools, "PAGE_CLOSE_TIMEOUT", 0.01):
+            async with asyncio.timeout(5):
+                result = await get_person_profile_minimal("testuser")
+
+        assert result["name"] == "Test User"
+        scrape_stack.page.close.assert_awaited_once()
+
+    async def test_batch_profiles_preserve_order_and_bound_concurrency(self):
+        """Test batch scraping keeps input order and honors the concurrency cap"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_scrape(username):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"name": username}
+
+        usernames = [f"user{i}" for i in range(6)]
+        with patch.dict("os.environ", {"LINKEDIN_MAX_CONCURRENCY": "2"}):
+            with patch(
+                "linkedin_mcp_server.tools.person.get_person_profile_minimal",
+                side_effect=fake_scrape,
+            ):
+                results = await get_person_profiles(usernames)
+
+        assert [result["name"] for result in results] == usernames
+        assert peak == 2
+
+    async def test_batch_profiles_invalid_concurrency_uses_default(self):
+        """Test that an unparsable LINKEDIN_MAX_CONCURRENCY falls back to the default"""
+        with patch.dict("os.environ", {"LINKEDIN_MAX_CONCURRENCY": "four"}):
+            with patch(
+                "linkedin_mcp_server.tools.person.get_person_profile_minimal",
+                AsyncMock(side_effect=lambda username: {"name": username}),
+            ):
+                results = await get_person_profiles(["ok"])
+
+            max_concurrency = person_tools._max_concurrency()
+
+        assert results == [{"name": "ok"}]
+        assert max_concurrency == person_tools.DEFAULT_MAX_CONCURRENCY
+
+    async def test_batch_profiles_map_exceptions_to_errors(self):
+        """Test that one failing profile yields an error entry, not a failed batch"""
+
+        async def fake_scrape(username):
+            if username == "broken":
+                raise RuntimeError("boom")
+            return {"name": username}
+
+        with patch(
+            "linkedin_mcp_server.tools.person.get_person_profile",
+            side_effect=fake_scrape,
+        ):
+            results = await get_person_profiles(["ok", "broken"], comprehensive=True)
+
+        assert results[0] == {"name": "ok"}
+        assert results[1]["error"] == "unknown_error"
+        assert "boom" in results[1]["message"]
+
+    async def test_repeat_profile_served_from_cache(
+        self, mock_person_minimal, scrape_stack
+    ):
+        """Test that a repeated lookup skips scraping and is marked as a cache hit"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_minimal
+
+        first = await get_person_profile_minimal("testuser")
+        second = await get_person_profile_minimal("testuser")
+
+        scrape_stack.scraper.scrape_page.assert_called_once()
+        assert second["name"] == first["name"]
+        assert second["_performance"]["cache"] == "hit"
+        assert "cache" not in first["_performance"]
+
+    async def test_mutated_response_does_not_change_cache(
+        self, mock_person_full, scrape_stack
+    ):
+        """Test that mutating a returned response leaves later cache hits intact"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_full
+
+        first = await get_person_profile("testuser")
+        first["experiences"].clear()
+        first["about"].append("injected")
+
+        second = await get_person_profile("testuser")
+        second["educations"].clear()
+
+        third = await get_person_profile("testuser")
+
+        assert third["_performance"]["cache"] == "hit"
+        assert third["experiences"] == FULL_PROFILE_DUMP["experiences"]
+        assert third["about"] == FULL_PROFILE_DUMP["about"]
+        assert third["educations"] == FULL_PROFILE_DUMP["educations"]
+
+    async def test_cached_profile_not_served_across_cookies(
+        self, mock_person_minimal, scrape_stack
+    ):
+        """Test that a cached profile is tied to the cookie that scraped it"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_minimal
+
+        await get_person_profile_minimal("testuser")
+
+        with patch.dict("os.environ", {"LINKEDIN_COOKIE": "other_cookie_value"}):
+            other = await get_person_profile_minimal("testuser")
+
+        with patch.dict("os.environ", {}, clear=True):
+            missing = await get_person_profile_minimal("testuser")
+
+        assert "cache" not in other["_performance"]
+        assert scrape_stack.scraper.scrape_page.await_count == 2
+        assert "LINKEDIN_COOKIE environment variable not set" in missing["message"]
+
+    async def test_cache_disabled_with_zero_ttl(
+        self, mock_person_minimal, scrape_stack
+    ):
+        """Test that LINKEDIN_CACHE_TTL=0 scrapes on every call"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_minimal
+
+        with patch.dict("os.environ", {"LINKEDIN_CACHE_TTL": "0"}):
+            await get_person_profile_minimal("testuser")
+            await get_person_profile_minimal("testuser")
+
+        assert scrape_stack.scraper.scrape_page.await_count == 2
+
+    async def test_navigation_timeout_retried_on_fresh_page(
+        self, mock_person_minimal, scrape_stack
+    ):
+        """Test that a goto timeout inside the real scraper is retried once"""
+        timed_out_page = _navigable_page(
+            goto=AsyncMock(side_effect=PlaywrightTimeoutError("Timeout 5000ms"))
+        )
+        ready_page = _navigable_page(goto=AsyncMock())
+        scrape_stack.context.new_page.side_effect = [timed_out_page, ready_page]
+
+        # Real scraper and controller, so the timeout travels through the
+        # navigation and stealth wrappers before reaching the retry check
+        scraper = ProfilePageScraper(
+            stealth_controller=StealthController(
+                profile=StealthProfile.NO_STEALTH(), telemetry=False
+            )
+        )
+        with (
+            patch.object(person_tools, "_profile_scraper", scraper),
+            patch.object(
+                scraper, "extract_data", AsyncMock(return_value=mock_person_minimal)
+            ),
+        ):
+            result = await get_person_profile_minimal("testuser")
+
+        assert result["name"] == "Test User"
+        assert scrape_stack.context.new_page.await_count == 2
+        timed_out_page.goto.assert_awaited_once()
+        ready_page.goto.assert_awaited_once()
+        timed_out_page.close.assert_awaited_once()
+
+    async def test_disconnected_browser_retried_on_relaunched_browser(
+        self, mock_person_minimal
+    ):
+        """Test that a retry after the browser died runs on a relaunched browser"""
+        dead_page = AsyncMock()
+        dead_page.url = "about:blank"
+        live_page = AsyncMock()
+        live_page.url = PROFILE_URL
+        live_page.is_closed = Mock(return_value=False)
+
+        def launched_browser(page):
+            browser = AsyncMock()
+            browser.is_connected = Mock(return_value=True)
+            context = AsyncMock()
+            context.new_page = AsyncMock(return_value=page)
+            browser.new_context = AsyncMock(return_value=context)
+            return browser
+
+        dead_browser = launched_browser(dead_page)
+        live_browser = launched_browser(live_page)
+
+        async def scrape_page(page, url, **kwargs):
+            if page is dead_page:
+                dead_browser.is_connected.return_value = False
+                raise PlaywrightError("Target page, context or browser has been closed")
+            return mock_person_minimal
+
+        scraper = Mock(
+            spec=["scrape_page"], scrape_page=AsyncMock(side_effect=scrape_page)
+        )
+        with (
+            patch.dict("os.environ", {"LINKEDIN_COOKIE": "test_cookie_value"}),
+            patch(
+                "linkedin_mcp_server.tools._browser_pool.async_playwright"
+            ) as mock_factory,
+            patch.object(person_tools, "_profile_scraper", scraper),
+        ):
+            playwright = AsyncMock()
+            playwright.chromium.launch = AsyncMock(
+                side_effect=[dead_browser, live_browser]
+            )
+            mock_factory.return_value.start = AsyncMock(return_value=playwright)
+            try:
+                result = await get_person_profile_minimal("testuser")
+            finally:
+                await _browser_pool.close_browser()
+
+        assert result["name"] == "Test User"
+        assert playwright.chromium.launch.await_count == 2
+        assert [call.args[0] for call in scraper.scrape_page.await_args_list] == [
+            dead_page,
+            live_page,
+        ]
+        dead_page.close.assert_awaited_once()
+
+    async def test_auth_wall_evicts_context(self, mock_person_minimal, scrape_stack):
+        """Test that a login wall evicts the cached context and reports the cookie"""
+        scrape_stack.scraper.scrape_page.return_value = mock_person_minimal
+        scrape_stack.page.url = "https://www.linkedin.com/authwall?trk=profile"
+
+        with patch.object(person_tools, "evict_context", AsyncMock()) as evict:
+            result = await get_person_profile_minimal("testuser")
+
+        assert result["error"] == "invalid_credentials"
+        evict.assert_awaited_once_with("test_cookie_value")
+        scrape_stack.scraper.scrape_page.assert_awaited_once()
+        assert not person_tools._profile_cache
+
+    async def test_non_transient_error_not_retried(self, scrape_stack):
+        """Test that non-browser failures go straight to the error response"""
+        scrape_stack.scraper.scrape_page.side_effect = ValueError("bad profile")
+
+        result = await get_person_profile_minimal("testuser")
+
+        assert result["error"] == "unknown_error"
+        scrape_stack.scraper.scrape_page.assert_awaited_once()
@@ -0,0 +1,60 @@
+# tests/unit/test_server.py
+"""
+Unit tests for the MCP server's session management tool.
+
+Tests that close_session releases everything the person tools hold: the
+shared browser, its cached contexts and pooled pages, and cached profiles.
+"""
+
+import pytest
+from fastmcp import Client
+from unittest.mock import AsyncMock, Mock, patch
+
+from linkedin_mcp_server.server import create_mcp_server
+from linkedin_mcp_server.tools import _browser_pool
+from linkedin_mcp_server.tools import person as person_tools
+
+
+@pytest.fixture
+def mock_playwright():
+    """Mock async_playwright() chain launching a connected browser"""
+    with patch(
+        "linkedin_mcp_server.tools._browser_pool.async_playwright"
+    ) as mock_factory:
+        playwright = AsyncMock()
+        browser = AsyncMock()
+        browser.is_connected = Mock(return_value=True)
+        browser.new_context = AsyncMock(side_effect=lambda **_: AsyncMock())
+        playwright.chromium.launch = AsyncMock(return_value=browser)
+        mock_factory.return_value.start = AsyncMock(return_value=playwright)
+        yield playwright
+
+
+async def test_close_session_releases_shared_browser(mock_playwright):
+    """Test that close_session closes the browser pool and clears the cache"""
+    context = await _browser_pool.get_context("test_cookie_value")
+    page = AsyncMock()
+    page.is_closed = Mock(return_value=False)
+    assert _browser_pool.park_page(context, page, 1)
+    person_tools._profile_cache[("session", "testuser", "minimal")] = (
+        float("inf"),
+        {"name": "Test User"},
+    )
+    browser = mock_playwright.chromium.launch.return_value
+
+    with patch(
+        "linkedin_mcp_server.session.manager.PlaywrightSessionManager.close_all_sessions",
+        AsyncMock(),
+    ) as close_all_sessions:
+        async with Client(create_mcp_server()) as client:
+            result = await client.call_tool("close_session", {})
+
+            # Checked before the server's lifespan closes the browser anyway
+            assert result.data["status"] == "success"
+            close_all_sessions.assert_awaited_once()
+            context.storage_state.assert_awaited_once()
+            browser.close.assert_awaited_once()
+            mock_playwright.stop.assert_awaited_once()
+            assert not _browser_pool._contexts
+            assert not _browser_pool._idle_pages
+            assert not person_tools._profile_cache
@@ -5,40 +5,64 @@ Unit tests for PlaywrightSessionManager.
 Tests session creation, reuse, cleanup, and thread safety.
 """
 
+import asyncio
+import stat
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
+from linkedin_mcp_server.session import _loop_cleanup
 from linkedin_mcp_server.session.manager import PlaywrightSessionManager
 
 
+class _FakeSession:
+    """Stand-in for LinkedInSession with the members the manager uses"""
+
+    def __init__(self):
+        self.entered = False
+        self.authenticated = False
+        self.close_calls = 0
+
+    async def __aenter__(self):
+        self.entered = True
+        self.authenticated = True
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def close(self):
+        self.close_calls += 1
+
+
 class TestPlaywrightSessionManager:
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock LinkedIn session"""
-        session = AsyncMock()
-        session.is_authenticated = AsyncMock(return_value=True)
-        session.__aenter__ = AsyncMock(return_value=session)
-        session.__aexit__ = AsyncMock()
-        session.close = AsyncMock()
-        return session
+    @pytest.fixture(autouse=True)
+    def clear_registry(self):
+        """Reset class-level session registry between tests"""
+        PlaywrightSessionManager._sessions = {}
+        PlaywrightSessionManager._session_locks = {}
+        yield
+        PlaywrightSessionManager._sessions = {}
+        PlaywrightSessionManager._session_locks = {}
 
     @pytest.fixture
-    def mock_linkedin_session_class(self, mock_session):
-        """Mock LinkedInSession class"""
+    def mock_linkedin_session_class(self):
+        """Mock LinkedInSession class whose from_cookie returns a fake session"""
         with patch("linkedin_mcp_server.session.manager.LinkedInSession") as mock_class:
-            mock_instance = AsyncMock()
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_instance.__aexit__ = AsyncMock()
-            mock_class.from_cookie.return_value = mock_instance
+            mock_class.from_cookie.return_value = _FakeSession()
             yield mock_class
 
     async def test_session_creation_success(self, mock_linkedin_session_class):
         """Test successful session creation with valid cookie"""
         session = await PlaywrightSessionManager.create_session("valid_cookie_123")
 
-        assert session is not None
+        assert session.entered
         mock_linkedin_session_class.from_cookie.assert_called_once_with(
-            "valid_cookie_123", headless=True
+            "valid_cookie_123",
+            headless=True,
+            storage_state_path=PlaywrightSessionManager._get_storage_state_path(
+                PlaywrightSessionManager._session_id_for_cookie("valid_cookie_123")
+            ),
         )
 
     async def test_get_or_create_session_delegates_to_create(
@@ -50,35 +74,128 @@ class TestPlaywrightSessionManager:
         )
 
         assert session is not None
-        mock_linkedin_session_class.from_cookie.assert_called_once_with(
-            "valid_cookie_123", headless=False
-        )
+        _, kwargs = mock_linkedin_session_class.from_cookie.call_args
+        assert kwargs["headless"] is False
 
     async def test_session_creation_failure(self, mock_linkedin_session_class):
-        """Test handling of session creation failures"""
-        mock_linkedin_session_class.from_cookie.side_effect = Exception(
-            "Creation failed"
-        )
+        """Test that session creation failures propagate unchanged"""
+        error = RuntimeError("Creation failed")
+        mock_linkedin_session_class.from_cookie.side_effect = error
 
-        with pytest.raises(Exception, match="Creation failed"):
+        # Callers map specific exception types to tool errors, so the original
+        # exception must be re-raised rather than wrapped
+        with pytest.raises(RuntimeError) as exc_info:
             await PlaywrightSessionManager.create_session("invalid_cookie")
+        assert exc_info.value is error
+
+    async def test_get_or_create_session_reuses_session(
+        self, mock_linkedin_session_class
+    ):
+        """Test that a second call with the same cookie reuses the session"""
+        first = await PlaywrightSessionManager.get_or_create_session("valid_cookie_123")
+        second = await PlaywrightSessionManager.get_or_create_session(
+            "valid_cookie_123"
+        )
+
+        assert first is second
+        mock_linkedin_session_class.from_cookie.assert_called_once()
+
+    async def test_concurrent_get_or_create_creates_single_session(
+        self, mock_linkedin_session_class
+    ):
+        """Test that 50 concurrent callers share a single session creation"""
+        sessions = await asyncio.gather(
+            *(
+                PlaywrightSessionManager.get_or_create_session("valid_cookie_123")
+                for _ in range(50)
+            )
+        )
+
+        assert len(PlaywrightSessionManager._sessions) == 1
+        assert all(session is sessions[0] for session in sessions)
+        mock_linkedin_session_class.from_cookie.assert_called_once()
+
+    async def test_unauthenticated_session_closed_and_replaced(
+        self, mock_linkedin_session_class
+    ):
+        """Test that a session that lost authentication is not reused"""
+        mock_linkedin_session_class.from_cookie.side_effect = lambda *args, **kwargs: (
+            _FakeSession()
+        )
+        first = await PlaywrightSessionManager.get_or_create_session("valid_cookie_123")
+        first.authenticated = False
 
-    def test_has_active_session_always_false(self):
-        """Test that has_active_session always returns False in simplified manager"""
+        second = await PlaywrightSessionManager.get_or_create_session(
+            "valid_cookie_123"
+        )
+
+        assert second is not first
+        assert first.close_calls == 1
+        assert list(PlaywrightSessionManager._sessions.values()) == [second]
+
+    async def test_registry_reset_closes_sessions_on_their_loop(self):
+        """Test that sessions from a previous event loop are closed, not dropped"""
+        old_loop = asyncio.new_event_loop()
+        session = _FakeSession()
+        PlaywrightSessionManager._sessions = {"stale": session}
+
+        with (
+            patch.object(PlaywrightSessionManager, "_registry_loop", old_loop),
+            patch.object(PlaywrightSessionManager, "_registry_lock", asyncio.Lock()),
+        ):
+            PlaywrightSessionManager._get_registry_lock()
+            await asyncio.gather(*_loop_cleanup._cleanup_tasks)
+        old_loop.close()
+
+        assert session.close_calls == 1
+        assert not PlaywrightSessionManager._sessions
+
+    def test_has_active_session_false_when_empty(self):
+        """Test that has_active_session is False with an empty registry"""
         assert not PlaywrightSessionManager.has_active_session()
 
-    async def test_get_active_session_always_none(self):
-        """Test that get_active_session always returns None in simplified manager"""
+    async def test_get_active_session_none_when_empty(self):
+        """Test that get_active_session returns None with an empty registry"""
         session = await PlaywrightSessionManager.get_active_session()
         assert session is None
 
-    async def test_close_all_sessions_no_op(self):
-        """Test that close_all_sessions is a no-op in simplified manager"""
-        # Should not raise any exceptions
+    async def test_close_all_sessions_closes_registered(
+        self, mock_linkedin_session_class
+    ):
+        """Test that close_all_sessions closes and forgets registered sessions"""
+        session = await PlaywrightSessionManager.get_or_create_session(
+            "valid_cookie_123"
+        )
+        assert PlaywrightSessionManager.has_active_session()
+
         await PlaywrightSessionManager.close_all_sessions()
 
+        assert session.close_calls == 1
+        assert not PlaywrightSessionManager.has_active_session()
+
     def test_get_storage_state_path(self):
         """Test storage state path generation"""
         path = PlaywrightSessionManager._get_storage_state_path("test_session")
         assert "session_test_session.json" in path
         assert ".cache/linkedin-mcp-server" in path
+
+    def test_storage_state_directory_private(self, tmp_path):
+        """Test the directory holding cookie-bearing state is user-only"""
+        cache_dir = tmp_path / ".cache" / "linkedin-mcp-server"
+        cache_dir.mkdir(mode=0o755, parents=True)
+
+        with patch("pathlib.Path.home", return_value=tmp_path):
+            PlaywrightSessionManager._get_storage_state_path("test_session")
+
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+
+    def test_session_id_for_cookie_is_stable_and_opaque(self):
+        """Test storage state is keyed by a cookie hash, not the raw cookie"""
+        session_id = PlaywrightSessionManager._session_id_for_cookie("secret_cookie")
+        assert session_id == PlaywrightSessionManager._session_id_for_cookie(
+            "secret_cookie"
+        )
+        assert session_id != PlaywrightSessionManager._session_id_for_cookie(
+            "other_cookie"
+        )
+        assert "secret_cookie" not in session_id